@@ -6,13 +6,19 @@ Module for API dependencies.
 from typing import TYPE_CHECKING
 
 # Imports from core application
-from app.core.application import get_core_application
+from app.core.application import get_core_application as _get_core_application
 
 
 if TYPE_CHECKING:
     # Imports from core application
     from app.core.application import CoreApplication
 
+    # Imports from logger core service
+    from app.core.base.logger import LogReader
+
+    # Imports from tracing core service
+    from app.core.base.tracing import Tracer
+
 
 # Get CoreApplication instance
 def get_core_application() -> "CoreApplication":
@@ -20,4 +26,22 @@ def get_core_application() -> "CoreApplication":
     Get CoreApplication instance.
     """
 
-    return get_core_application()
+    return _get_core_application()
+
+
+# Get LogReader instance
+def get_log_reader() -> "LogReader":
+    """
+    Get LogReader instance.
+    """
+
+    return _get_core_application().container.log_reader()
+
+
+# Get Tracer instance
+def get_tracer() -> "Tracer":
+    """
+    Get Tracer instance.
+    """
+
+    return _get_core_application().container.tracer()
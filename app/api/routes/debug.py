@@ -0,0 +1,46 @@
+"""
+Debug API routes
+"""
+
+# Imports from standard library
+from typing import Optional
+
+# Import from third party
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+# Imports from API dependencies
+from app.api.deps import get_tracer
+
+# Imports from tracing core service
+from app.core.base.tracing import Tracer, to_otlp
+
+
+# Define router
+router = APIRouter(
+    prefix="/debug",
+    tags=["debug"],
+)
+
+
+@router.get("/traces")
+def traces(
+    trace_id: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=100000),
+    format: str = Query("json", pattern="^(json|otlp)$"),
+    tracer: Tracer = Depends(get_tracer),
+):
+    """
+    Recently finished spans from the in-memory ring, newest last.
+    """
+
+    if not tracer.enabled:
+        raise HTTPException(status_code=404, detail="Tracing is disabled")
+
+    spans = tracer.ring.spans(trace_id=trace_id, limit=limit)
+    if format == "otlp":
+        return to_otlp(spans)
+
+    return {
+        "sample_rate": tracer.sample_rate,
+        "spans": [span.to_dict() for span in spans],
+    }
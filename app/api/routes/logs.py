@@ -0,0 +1,68 @@
+"""
+Logs API routes
+"""
+
+# Imports from standard library
+from datetime import datetime
+from itertools import chain
+from typing import Optional
+
+# Import from third party
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+# Imports from API dependencies
+from app.api.deps import get_log_reader
+from app.api.server.cache import CachedRoute, cache_response
+from app.api.server.responses import FastJSONResponse, NDJSONResponse
+
+# Imports from logger core service
+from app.core.base.logger import LogQuery, LogReader
+
+
+# Define router
+router = APIRouter(
+    prefix="/logs",
+    tags=["logs"],
+    route_class=CachedRoute,
+)
+
+
+@router.get("")
+@cache_response(ttl=2, tags=("logs",))
+def query_logs(
+    request: Request,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    level: Optional[str] = None,
+    logger: Optional[str] = None,
+    contains: Optional[str] = None,
+    limit: int = Query(1000, ge=1, le=100000),
+    reader: LogReader = Depends(get_log_reader),
+):
+    """
+    Query log records by time range, level, logger name and substring.
+
+    Records are streamed as NDJSON when requested with
+    `Accept: application/x-ndjson`.
+    """
+
+    query = LogQuery(
+        start=start,
+        end=end,
+        level=level,
+        logger=logger,
+        contains=contains,
+        limit=limit,
+    )
+
+    # Pull first entry so invalid filters fail before streaming starts
+    try:
+        entries = reader.query(query)
+        first = next(entries, None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if NDJSONResponse.media_type in request.headers.get("accept", ""):
+        return NDJSONResponse(chain([first] if first else [], entries))
+
+    return FastJSONResponse(([first] if first else []) + list(entries))
@@ -3,7 +3,7 @@ Root API routes
 """
 
 # Import from third party
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 
 # Define router
@@ -11,3 +11,25 @@ router = APIRouter(
     prefix="/root",
     tags=["root"],
 )
+
+
+@router.get("/health")
+def health():
+    """
+    Liveness probe.
+    """
+
+    return {"status": "ok"}
+
+
+@router.get("/status")
+def status(request: Request):
+    """
+    Server load status (admission control state).
+    """
+
+    admission = getattr(request.app.state, "admission", None)
+    return {
+        "status": "ok",
+        "admission": admission.snapshot() if admission is not None else None,
+    }
@@ -0,0 +1,299 @@
+"""
+Module for API admission control and load shedding.
+"""
+
+# Imports from standard library
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+# Imports from third party libraries
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Imports from local modules
+from app.api.server.responses import FastJSONResponse
+
+# Imports from tracing core service
+from app.core.base.tracing import span
+
+
+# Weight of the newest sample in moving averages
+_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class RouteStats:
+    """Per-route admission statistics"""
+
+    in_flight: int = 0
+    requests: int = 0
+    shed: int = 0
+    latency: float = 0.0
+    queue_delay: float = 0.0
+
+    def observe(self, latency: float, queue_delay: float) -> None:
+        self.requests += 1
+        self.latency += _EWMA_ALPHA * (latency - self.latency)
+        self.queue_delay += _EWMA_ALPHA * (queue_delay - self.queue_delay)
+
+
+class ConcurrencyLimiter:
+    """Concurrency limit with bounded FIFO wait queue"""
+
+    def __init__(self, limit: float, max_queue: int):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def try_acquire(self) -> bool:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Wait for a slot up to timeout; False when queue is full or timed out.
+        """
+
+        if self.try_acquire():
+            return True
+        if len(self._waiters) >= self.max_queue or timeout <= 0:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+            return True
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over at the same moment, give it back
+                self.release()
+            else:
+                waiter.cancel()
+            return False
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(True)
+
+
+class AdmissionController:
+    """Adaptive admission control state shared by middleware and status routes"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 64,
+        min_concurrency: int = 4,
+        max_queue: int = 128,
+        queue_timeout: float = 0.5,
+        latency_target: float = 1.0,
+        adjust_interval: float = 1.0,
+        priority_paths: Iterable[str] = (),
+        routes: Optional[Dict[str, int]] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.queue_timeout = queue_timeout
+        self.latency_target = latency_target
+        self.adjust_interval = adjust_interval
+        self.priority_paths = tuple(priority_paths)
+        self.limiter = ConcurrencyLimiter(max_concurrency, max_queue)
+        self.route_limiters = {
+            path: ConcurrencyLimiter(limit, max_queue)
+            for path, limit in (routes or {}).items()
+        }
+        self.stats: Dict[str, RouteStats] = {}
+        self._latency = 0.0
+        self._adjusted_at = time.monotonic()
+        self._route_cache: Dict[Tuple[str, str], str] = {}
+
+    def is_priority(self, path: str) -> bool:
+        return path.startswith(self.priority_paths) if self.priority_paths else False
+
+    def route_key(self, scope: Scope) -> str:
+        """
+        Get route path template so stats do not grow with path parameters.
+        """
+
+        path = scope["path"]
+        cache_key = (scope.get("method", ""), path)
+        key = self._route_cache.get(cache_key)
+        if key is not None:
+            return key
+
+        # Same resolution as router: first full match, else first partial one
+        # (path matches, method does not, e.g. HEAD or CORS preflight)
+        key = None
+        partial = "<unmatched>"
+        app = scope.get("app")
+        for route in getattr(getattr(app, "router", None), "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                key = getattr(route, "path", path)
+                break
+            if match == Match.PARTIAL and partial == "<unmatched>":
+                partial = getattr(route, "path", path)
+        key = key or partial
+
+        if len(self._route_cache) < 4096:
+            self._route_cache[cache_key] = key
+        return key
+
+    def expected_wait(self) -> float:
+        """
+        Estimate queueing delay for a request arriving now.
+        """
+
+        limiter = self.limiter
+        if limiter.in_flight < int(limiter.limit):
+            return 0.0
+
+        return (limiter.queued + 1) * self._latency / max(int(limiter.limit), 1)
+
+    def retry_after(self) -> int:
+        """
+        Estimate seconds until capacity frees up.
+        """
+
+        backlog = self.limiter.queued + self.limiter.in_flight
+        per_slot = max(self._latency, 0.001)
+        return max(1, math.ceil(backlog * per_slot / max(int(self.limiter.limit), 1)))
+
+    def observe(self, latency: float) -> None:
+        """
+        Adapt global limit: shrink while latency is over target, grow when saturated.
+        """
+
+        self._latency += _EWMA_ALPHA * (latency - self._latency)
+        now = time.monotonic()
+        if now - self._adjusted_at < self.adjust_interval:
+            return
+        self._adjusted_at = now
+
+        limiter = self.limiter
+        if self._latency > self.latency_target:
+            limiter.limit = max(self.min_concurrency, limiter.limit * 0.9)
+        elif limiter.in_flight >= int(limiter.limit) - 1 or limiter.queued:
+            limiter.limit = min(self.max_concurrency, limiter.limit + 1)
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "queued": self.limiter.queued,
+            "latency": round(self._latency, 6),
+            "routes": {
+                path: {
+                    "in_flight": stats.in_flight,
+                    "requests": stats.requests,
+                    "shed": stats.shed,
+                    "latency": round(stats.latency, 6),
+                    "queue_delay": round(stats.queue_delay, 6),
+                }
+                for path, stats in self.stats.items()
+            },
+        }
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware limiting concurrency and shedding load with 503"""
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller
+        key = controller.route_key(scope)
+        stats = controller.stats.setdefault(key, RouteStats())
+
+        # Health and status endpoints are never queued or shed
+        if controller.is_priority(scope["path"]):
+            await self._call(scope, receive, send, stats, 0.0)
+            return
+
+        # Shed early instead of queueing requests that would miss the target
+        if controller.expected_wait() > controller.queue_timeout:
+            await self._shed(scope, receive, send, stats)
+            return
+
+        queued_at = time.monotonic()
+        route_limiter = controller.route_limiters.get(key)
+        with span("admission.queue", route=key) as queue_span:
+            # Route slot first so a burst on one route waits without holding
+            # global slots other routes need
+            admitted = True
+            if route_limiter is not None:
+                admitted = await route_limiter.acquire(controller.queue_timeout)
+            if admitted:
+                remaining = controller.queue_timeout - (time.monotonic() - queued_at)
+                admitted = await controller.limiter.acquire(remaining)
+                if not admitted and route_limiter is not None:
+                    route_limiter.release()
+            queue_span.set_attribute("admitted", admitted)
+        if not admitted:
+            await self._shed(scope, receive, send, stats)
+            return
+
+        queue_delay = time.monotonic() - queued_at
+        try:
+            latency = await self._call(scope, receive, send, stats, queue_delay)
+            controller.observe(latency)
+        finally:
+            if route_limiter is not None:
+                route_limiter.release()
+            controller.limiter.release()
+
+    async def _call(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        stats: RouteStats,
+        queue_delay: float,
+    ) -> float:
+        started = time.monotonic()
+        stats.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            stats.in_flight -= 1
+            latency = time.monotonic() - started
+            stats.observe(latency, queue_delay)
+
+        return latency
+
+    async def _shed(
+        self, scope: Scope, receive: Receive, send: Send, stats: RouteStats
+    ) -> None:
+        stats.shed += 1
+        response = FastJSONResponse(
+            {"detail": "Server is overloaded, retry later"},
+            status_code=503,
+            headers={"Retry-After": str(self.controller.retry_after())},
+        )
+        await response(scope, receive, send)
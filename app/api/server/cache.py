@@ -0,0 +1,254 @@
+"""
+Module for API response caching and conditional requests.
+"""
+
+# Imports from standard library
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# Imports from third party libraries
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+# Headers kept when replaying cached response
+_CACHED_HEADERS = ("content-type",)
+
+
+@dataclass
+class CachedResponse:
+    """Cached response body with validators"""
+
+    body: bytes
+    headers: Dict[str, str]
+    status_code: int
+    etag: str
+    last_modified: float
+    expires: float
+    tags: Tuple[str, ...]
+    versions: Tuple[int, ...] = field(default_factory=tuple)
+
+
+class ResponseCache:
+    """Bounded LRU cache of rendered responses with TTL and tag invalidation"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_entries: int = 1024):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        # Bumped when the whole cache is cleared
+        self._generation = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _tag_versions(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        return (self._generation, *(self._versions.get(tag, 0) for tag in tags))
+
+    def versions(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """
+        Snapshot tag versions; take it before rendering the response to cache.
+        """
+
+        with self._lock:
+            return self._tag_versions(tags)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Get fresh cached response or None.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if (
+                entry.expires < time.monotonic()
+                or self._tag_versions(entry.tags) != entry.versions
+            ):
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def peek(self, key: str) -> Optional[CachedResponse]:
+        """
+        Get cached response even if stale (used to keep Last-Modified stable).
+        """
+
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store response, evicting least recently used entries over the bounds.
+
+        entry.versions must be snapshot before the response was rendered, so
+        invalidation during rendering leaves the stored entry stale.
+        """
+
+        if len(entry.body) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = entry
+            self._size += len(entry.body)
+
+            while self._entries and (
+                self._size > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Invalidate all cached responses with any of the given tags.
+
+        Without tags the whole cache is cleared.
+        """
+
+        with self._lock:
+            if not tags:
+                self._entries.clear()
+                self._size = 0
+                self._generation += 1
+                return
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cache_response(ttl: float, tags: Iterable[str] = ()) -> Callable:
+    """
+    Opt route endpoint in response caching.
+
+    Must be applied below the router decorator:
+
+        router = APIRouter(route_class=CachedRoute)
+
+        @router.get("/items")
+        @cache_response(ttl=5, tags=("items",))
+        def list_items(): ...
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__cache_options__ = (ttl, tuple(tags))
+        return endpoint
+
+    return decorator
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """
+    Check If-None-Match / If-Modified-Since validators.
+    """
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [value.strip() for value in if_none_match.split(",")]
+        return "*" in candidates or any(
+            value.removeprefix("W/") == etag for value in candidates
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+
+    return False
+
+
+def _validator_headers(entry: CachedResponse, ttl: float) -> Dict[str, str]:
+    return {
+        "ETag": entry.etag,
+        "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+        "Cache-Control": f"max-age={int(ttl)}, must-revalidate",
+    }
+
+
+class CachedRoute(APIRoute):
+    """API route serving opted-in GET endpoints from ResponseCache"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        options = getattr(self.endpoint, "__cache_options__", None)
+        if options is None:
+            return handler
+
+        ttl, tags = options
+
+        async def cached_handler(request: Request) -> Response:
+            cache: Optional[ResponseCache] = getattr(
+                request.app.state, "response_cache", None
+            )
+            if cache is None or request.method not in ("GET", "HEAD"):
+                return await handler(request)
+
+            query = "&".join(sorted(request.url.query.split("&")))
+            key = (
+                f"{request.url.path}?{query}"
+                f"|{request.headers.get('accept', '')}"
+            )
+
+            entry = cache.get(key)
+            if entry is None:
+                versions = cache.versions(tags)
+                response = await handler(request)
+
+                # Streaming and error responses are not cached
+                body = getattr(response, "body", None)
+                if response.status_code != 200 or body is None:
+                    return response
+
+                etag = _etag(body)
+                previous = cache.peek(key)
+                entry = CachedResponse(
+                    body=body,
+                    headers={
+                        name: value
+                        for name, value in response.headers.items()
+                        if name in _CACHED_HEADERS
+                    },
+                    status_code=response.status_code,
+                    etag=etag,
+                    last_modified=(
+                        previous.last_modified
+                        if previous is not None and previous.etag == etag
+                        else time.time()
+                    ),
+                    expires=time.monotonic() + ttl,
+                    tags=tags,
+                    versions=versions,
+                )
+                cache.set(key, entry)
+
+            headers = _validator_headers(entry, ttl)
+            if _not_modified(request, entry.etag, entry.last_modified):
+                return Response(status_code=304, headers=headers)
+
+            headers.update(entry.headers)
+            return Response(
+                content=entry.body, status_code=entry.status_code, headers=headers
+            )
+
+        return cached_handler
@@ -0,0 +1,168 @@
+"""
+Module for API response compression middleware.
+"""
+
+# Imports from standard library
+import zlib
+from typing import List, Optional
+
+# Imports from third party libraries
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Try use brotli compression
+try:
+    import brotli
+
+    BROTLI_INSTALLED = True
+except ImportError:
+    BROTLI_INSTALLED = False
+
+
+def _accepted_encodings(header: str) -> List[str]:
+    """
+    Parse Accept-Encoding header, dropping encodings with q=0.
+    """
+
+    encodings = []
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:] in ("0", "0.0", "0.00", "0.000"):
+            continue
+        if name:
+            encodings.append(name.lower())
+
+    return encodings
+
+
+class _Compressor:
+    """Incremental compressor for one response body"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        """
+        Compress chunk; flush makes the output decodable up to this point.
+        """
+
+        if self.encoding == "br":
+            out = self._br.process(data)
+            return out + self._br.flush() if flush else out
+
+        out = self._gz.compress(data)
+        return out + self._gz.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.finish()
+
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        enable_brotli: bool = True,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.enable_brotli = enable_brotli and BROTLI_INSTALLED
+
+    def _select_encoding(self, scope: Scope) -> Optional[str]:
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if self.enable_brotli and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(scope)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = Headers(raw=start_message["headers"])
+                if (
+                    "content-encoding" in headers
+                    or (not more_body and len(body) < self.minimum_size)
+                    or headers.get("content-type", "").startswith("text/event-stream")
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(
+                    encoding, self.gzip_level, self.brotli_quality
+                )
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                    data = compressor.compress(body, flush=True)
+                else:
+                    data = compressor.finish(body)
+                    headers["Content-Length"] = str(len(data))
+                await send(start_message)
+                await send(
+                    {"type": "http.response.body", "body": data, "more_body": more_body}
+                )
+                return
+
+            # Streamed chunks are not flushed to keep the compression ratio,
+            # the compressor emits output as its internal buffers fill
+            data = compressor.compress(body, flush=False) if more_body else None
+            if data is None:
+                data = compressor.finish(body)
+            elif not data:
+                return
+            await send(
+                {"type": "http.response.body", "body": data, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+        # Response without body messages (e.g. HEAD handled upstream)
+        if start_message is not None and compressor is None and not passthrough:
+            await send(start_message)
@@ -0,0 +1,111 @@
+"""
+Module for API response classes.
+"""
+
+# Imports from standard library
+import dataclasses
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, AsyncIterable, Iterable, Union
+
+# Imports from third party libraries
+from starlette.concurrency import iterate_in_threadpool
+from starlette.responses import JSONResponse, StreamingResponse
+
+
+# Try use orjson for serialization
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serialize objects not supported natively by the JSON backend.
+    """
+
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("utf-8", "replace")
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes (orjson if installed, json otherwise).
+    """
+
+    if ORJSON_INSTALLED:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, falling back to json"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    """Newline delimited JSON response streamed item by item"""
+
+    media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        content: Union[Iterable[Any], AsyncIterable[Any]],
+        status_code: int = 200,
+        headers: dict = None,
+        background=None,
+    ):
+        if hasattr(content, "__aiter__"):
+            body = self._encode_async(content)
+        else:
+            # Run sync iterators in threadpool, they may block on I/O
+            body = iterate_in_threadpool(self._encode(content))
+
+        super().__init__(
+            body,
+            status_code=status_code,
+            headers=headers,
+            media_type=self.media_type,
+            background=background,
+        )
+
+    @staticmethod
+    def _encode(content: Iterable[Any]) -> Iterable[bytes]:
+        for item in content:
+            yield dumps(item) + b"\n"
+
+    @staticmethod
+    async def _encode_async(content: AsyncIterable[Any]) -> AsyncIterable[bytes]:
+        async for item in content:
+            yield dumps(item) + b"\n"
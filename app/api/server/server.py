@@ -12,13 +12,27 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 
+# Imports from local modules
+from app.api.server.admission import AdmissionControlMiddleware, AdmissionController
+from app.api.server.compression import CompressionMiddleware
+from app.api.server.responses import FastJSONResponse
+from app.api.server.tracing import TracingMiddleware
+
 # Imports from local routes
 from app.api.routes.root import router as root_router
+from app.api.routes.logs import router as logs_router
+from app.api.routes.debug import router as debug_router
 
 if TYPE_CHECKING:
     # Imports from standard library
     import logging
 
+    # Imports from local modules
+    from app.api.server.cache import ResponseCache
+
+    # Imports from tracing core service
+    from app.core.base.tracing import Tracer
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,11 +43,22 @@ async def lifespan(app: FastAPI):
     # ADDS threads for api server
     # if config["name_of_service"]:
     #     threading.Thread(target=app_ctx.name_of_service.start, daemon=True).start()
+    if app_ctx.container.configuration.scheduler.enabled():
+        app_ctx.scheduler.start()
     yield
+    if app_ctx.container.configuration.scheduler.enabled():
+        app_ctx.scheduler.stop()
+    # Flush spans buffered by file exporter
+    app_ctx.container.tracer().close()
 
 
 # Create FastAPI app
-def create_api_server(configuration: dict, logger: "logging.Logger") -> FastAPI:
+def create_api_server(
+    configuration: dict,
+    logger: "logging.Logger",
+    response_cache: "ResponseCache" = None,
+    tracer: "Tracer" = None,
+) -> FastAPI:
     """
     Create FastAPI app.
     """
@@ -43,12 +68,62 @@ def create_api_server(configuration: dict, logger: "logging.Logger") -> FastAPI:
 
     try:
         # Create FastAPI app
-        app = FastAPI(lifespan=lifespan)
+        app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+
+        # Attach response cache used by CachedRoute endpoints
+        app.state.response_cache = response_cache
+
+        # Attach tracer used by tracing middleware and debug routes
+        app.state.tracer = tracer
 
         # Include routers
         app.include_router(root_router, prefix="/api/v1")
-
-        # Configs CORS
+        app.include_router(logs_router, prefix="/api/v1")
+        app.include_router(debug_router, prefix="/api/v1")
+
+        # Configs response compression
+        compression_config = api_config.get("compression")
+        if not compression_config:
+            logger.warning(
+                "Compression configuration not found, using default settings"
+            )
+            compression_config = {"enabled": True}
+
+        if compression_config.get("enabled", True):
+            app.add_middleware(
+                CompressionMiddleware,
+                minimum_size=compression_config.get("minimum_size", 1024),
+                gzip_level=compression_config.get("gzip_level", 6),
+                brotli_quality=compression_config.get("brotli_quality", 4),
+                enable_brotli=compression_config.get("brotli", True),
+            )
+
+        # Configs admission control
+        admission_config = api_config.get("admission")
+        if not admission_config:
+            logger.warning(
+                "Admission configuration not found, using default settings"
+            )
+            admission_config = {"enabled": True}
+
+        if admission_config.get("enabled", True):
+            app.state.admission = AdmissionController(
+                max_concurrency=admission_config.get("max_concurrency", 64),
+                min_concurrency=admission_config.get("min_concurrency", 4),
+                max_queue=admission_config.get("max_queue", 128),
+                queue_timeout=admission_config.get("queue_timeout", 0.5),
+                latency_target=admission_config.get("latency_target", 1.0),
+                priority_paths=admission_config.get(
+                    "priority_paths", ["/api/v1/root/health", "/api/v1/root/status"]
+                ),
+                routes=admission_config.get("routes"),
+            )
+            app.add_middleware(
+                AdmissionControlMiddleware, controller=app.state.admission
+            )
+
+        # Configs CORS (outer to admission so shed responses carry CORS
+        # headers and preflight requests are answered without queueing)
         cors_config = api_config["cors"]
         if not cors_config:
             logger.warning("CORS configuration not found, using default settings")
@@ -65,8 +140,13 @@ def create_api_server(configuration: dict, logger: "logging.Logger") -> FastAPI:
             allow_credentials=cors_config["allow_credentials"],
             allow_methods=cors_config["allow_methods"],
             allow_headers=cors_config["allow_headers"],
+            expose_headers=cors_config.get("expose_headers", ["Retry-After"]),
         )
 
+        # Configs request tracing (added last to run first)
+        if tracer is not None and tracer.enabled:
+            app.add_middleware(TracingMiddleware, tracer=tracer)
+
         # Register routes
 
         logger.info("API server created successfully")
@@ -0,0 +1,47 @@
+"""
+Module for API request tracing middleware.
+"""
+
+# Imports from third party libraries
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Imports from tracing core service
+from app.core.base.tracing import Tracer
+
+
+class TracingMiddleware:
+    """ASGI middleware starting a root span per HTTP request"""
+
+    def __init__(self, app: ASGIApp, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_span = self.tracer.start_trace(
+            f"HTTP {scope['method']}",
+            traceparent=Headers(scope=scope).get("traceparent"),
+            path=scope["path"],
+        )
+        if not request_span.sampled:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                request_span.set_attribute("status", message["status"])
+                headers = MutableHeaders(scope=message)
+                headers["traceparent"] = request_span.traceparent
+            await send(message)
+
+        with request_span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    request_span.set_attribute("route", getattr(route, "path", ""))
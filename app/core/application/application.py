@@ -15,6 +15,7 @@ from fastapi import FastAPI
 # Imports from base core services
 from app.core.base.container import Container
 from app.core.base.commander import CommandExecutor
+from app.core.base.scheduler import CommandScheduler
 
 
 # Loads configuration to container configuration provider
@@ -61,6 +62,30 @@ def _load_configuration(container: Container) -> None:
     )
 
 
+# Configuration keys whose values are never logged
+_SECRET_KEYS = ("token", "password", "secret")
+
+
+def _redact(configuration):
+    """
+    Copy configuration with secret values masked for logging
+    """
+
+    if isinstance(configuration, dict):
+        return {
+            key: (
+                "***"
+                if value and any(part in str(key).lower() for part in _SECRET_KEYS)
+                else _redact(value)
+            )
+            for key, value in configuration.items()
+        }
+    if isinstance(configuration, list):
+        return [_redact(value) for value in configuration]
+
+    return configuration
+
+
 def init_container() -> Container:
     """
     Initialize container
@@ -111,7 +136,9 @@ class CoreApplication(FastAPI):
         self.__inner_logger.info(
             "Configuration path: %s", self._container.configuration_path
         )
-        self.__inner_logger.debug("Configuration: %s", self._container.configuration())
+        self.__inner_logger.debug(
+            "Configuration: %s", _redact(self._container.configuration())
+        )
 
         # Log scripts path
         self.__inner_logger.info("Scripts path: %s", self._container.scripts_path)
@@ -124,6 +151,10 @@ class CoreApplication(FastAPI):
         self._commander = self._container.commander()
         self.__inner_logger.info("Commander initialized")
 
+        # Initialize Scheduler
+        self._scheduler = self._container.scheduler()
+        self.__inner_logger.info("Scheduler initialized")
+
         # Initialize API Server
         self._api_server = self._container.api_server
         self.__inner_logger.info("API server initialized")
@@ -148,6 +179,10 @@ class CoreApplication(FastAPI):
     def commander(self) -> CommandExecutor:
         return self._commander
 
+    @property
+    def scheduler(self) -> CommandScheduler:
+        return self._scheduler
+
     @property
     def api_server(self) -> FastAPI:
         return self._api_server
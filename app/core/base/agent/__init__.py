@@ -0,0 +1,5 @@
+from .agent import CommandAgent
+from .coordinator import AgentConnection, DistributedExecutor
+from .protocol import ProtocolError
+
+__all__ = ["CommandAgent", "AgentConnection", "DistributedExecutor", "ProtocolError"]
@@ -0,0 +1,288 @@
+"""
+Module for agent mode: executing commands received from a coordinator.
+"""
+
+# Imports from standard library
+import hmac
+import logging
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+# Imports from commander core service
+from app.core.base.commander import CommandExecutor, CommandResult, CommandStatus
+
+# Imports from tracing core service
+from app.core.base.tracing import Tracer
+
+# Imports from local modules
+from .protocol import (
+    ProtocolError,
+    parse_address,
+    recv_frame,
+    result_to_dict,
+    send_frame,
+)
+
+
+class CommandAgent:
+    """Class serving command execution requests from coordinators"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        commander: CommandExecutor,
+        address: str = "127.0.0.1:7070",
+        agent_id: Optional[str] = None,
+        capacity: int = 8,
+        labels: Optional[Dict[str, str]] = None,
+        token: Optional[str] = None,
+        allow_sudo: bool = False,
+        tracer: Optional[Tracer] = None,
+    ):
+        self._logger = logger.getChild("CommandAgent")
+        self._commander = commander
+        self._tracer = tracer or Tracer()
+        self.address = address
+        self.agent_id = agent_id or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self.capacity = capacity
+        self.labels = labels or {}
+        self.token = token
+        self.allow_sudo = allow_sudo
+        self._pool = ThreadPoolExecutor(
+            max_workers=capacity, thread_name_prefix="agent-command"
+        )
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._server: Optional[socket.socket] = None
+        self._connections: Set[socket.socket] = set()
+        self._stopped = threading.Event()
+
+    @property
+    def load(self) -> int:
+        return self._in_flight
+
+    def _bind(self) -> socket.socket:
+        family, target = parse_address(self.address)
+        if family != socket.AF_UNIX and not self.token:
+            # Any local user could connect to a loopback port as well
+            raise ValueError(f"Agent token is required to listen on {self.address}")
+
+        if family != socket.AF_UNIX:
+            # Family from resolution so IPv6 hosts ("[::1]:7070") bind too
+            family, _, _, _, target = socket.getaddrinfo(
+                *target, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+            )[0]
+
+        server = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_UNIX:
+            directory = os.path.dirname(target)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if os.path.exists(target):
+                os.remove(target)
+        else:
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(target)
+        if family == socket.AF_UNIX:
+            # Owner only; connects are refused until listen() below
+            os.chmod(target, 0o600)
+        server.listen(16)
+
+        return server
+
+    def start(self) -> None:
+        """
+        Start serving in background thread.
+
+        Raises:
+            ValueError: If listening on TCP address without token.
+        """
+
+        self._server = self._bind()
+        threading.Thread(
+            target=self._accept_loop, name="agent-accept", daemon=True
+        ).start()
+        self._logger.info(
+            "Agent %s listening on %s (capacity=%d)",
+            self.agent_id,
+            self.address,
+            self.capacity,
+        )
+
+    def serve_forever(self) -> None:
+        """
+        Serve until stop() is called.
+        """
+
+        self.start()
+        self._stopped.wait()
+
+    def stop(self) -> None:
+        """
+        Stop accepting connections; running commands are left to finish.
+        """
+
+        self._stopped.set()
+        if self._server is not None:
+            # Shutdown wakes thread blocked in accept()
+            for sock in [self._server, *list(self._connections)]:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self._server.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._logger.info("Agent %s stopped", self.agent_id)
+
+    def _accept_loop(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                conn, peer = self._server.accept()
+            except OSError:
+                break
+            if conn.family != socket.AF_UNIX:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                target=self._serve_connection,
+                args=(conn, peer),
+                name="agent-connection",
+                daemon=True,
+            ).start()
+
+    def _handshake(self, conn: socket.socket) -> bool:
+        """
+        Check coordinator hello and reply with agent description.
+        """
+
+        hello = recv_frame(conn)
+        if hello is None or hello["type"] != "hello":
+            return False
+        if self.token and not hmac.compare_digest(
+            str(hello.get("token") or "").encode(), self.token.encode()
+        ):
+            send_frame(conn, {"type": "error", "error": "Invalid token"})
+            return False
+
+        send_frame(
+            conn,
+            {
+                "type": "welcome",
+                "agent_id": self.agent_id,
+                "capacity": self.capacity,
+                "labels": self.labels,
+                "load": self._in_flight,
+            },
+        )
+        return True
+
+    def _serve_connection(self, conn: socket.socket, peer) -> None:
+        send_lock = threading.Lock()
+        self._connections.add(conn)
+        with conn:
+            try:
+                if not self._handshake(conn):
+                    self._logger.warning("Rejected coordinator %s", peer)
+                    return
+                self._logger.info("Coordinator connected: %s", peer or "unix")
+
+                while not self._stopped.is_set():
+                    message = recv_frame(conn)
+                    if message is None:
+                        break
+                    if message["type"] == "ping":
+                        send_frame(
+                            conn,
+                            {"type": "pong", "load": self._in_flight},
+                            send_lock,
+                        )
+                    elif message["type"] == "execute":
+                        with self._in_flight_lock:
+                            self._in_flight += 1
+                        self._pool.submit(self._execute, conn, send_lock, message)
+                    else:
+                        raise ProtocolError(f"Unknown message: {message['type']}")
+
+            except (OSError, ProtocolError) as e:
+                self._logger.warning("Coordinator connection %s failed: %s", peer, e)
+            finally:
+                self._connections.discard(conn)
+
+        self._logger.info("Coordinator disconnected: %s", peer or "unix")
+
+    def _execute(self, conn: socket.socket, send_lock: threading.Lock, message):
+        try:
+            if message.get("use_sudo") and not self.allow_sudo:
+                raise PermissionError("sudo is not allowed on this agent")
+
+            # Continue coordinator trace, commander spans nest under it
+            with self._tracer.start_trace(
+                "agent.execute",
+                traceparent=message.get("traceparent"),
+                agent=self.agent_id,
+            ):
+                result = self._commander.execute(
+                    message["command"],
+                    use_sudo=message.get("use_sudo", False),
+                    use_shell=message.get("use_shell", False),
+                    timeout=message.get("timeout"),
+                    policy=message.get("policy"),
+                )
+        except Exception as e:
+            result = CommandResult(
+                status=CommandStatus.FAILED,
+                stdout="",
+                stderr=str(e),
+                return_code=-1,
+                command=str(message.get("command")),
+            )
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+
+        try:
+            try:
+                self._send_result(conn, send_lock, message["id"], result)
+            except ProtocolError as e:
+                # Oversized output would make the coordinator drop this agent
+                self._logger.warning(
+                    "Result of %s not sent: %s", result.command, str(e)
+                )
+                self._send_result(
+                    conn,
+                    send_lock,
+                    message["id"],
+                    CommandResult(
+                        status=CommandStatus.FAILED,
+                        stdout="",
+                        stderr=f"Result not sent: {e}",
+                        return_code=result.return_code,
+                        command=result.command,
+                    ),
+                )
+        except OSError as e:
+            self._logger.warning(
+                "Failed to send result of %s: %s", result.command, str(e)
+            )
+
+    def _send_result(
+        self,
+        conn: socket.socket,
+        send_lock: threading.Lock,
+        request_id,
+        result: CommandResult,
+    ) -> None:
+        send_frame(
+            conn,
+            {
+                "type": "result",
+                "id": request_id,
+                "result": result_to_dict(result),
+                "load": self._in_flight,
+            },
+            send_lock,
+        )
+
@@ -0,0 +1,375 @@
+"""
+Module for executing commands across registered agents.
+"""
+
+# Imports from standard library
+import itertools
+import logging
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Imports from commander core service
+from app.core.base.commander import CommandResult, CommandStatus
+
+# Imports from tracing core service
+from app.core.base.tracing import current_span
+
+# Imports from local modules
+from .protocol import ProtocolError, connect, recv_frame, result_from_dict, send_frame
+
+
+@dataclass
+class _Task:
+    """Command dispatched to an agent"""
+
+    id: int
+    request: Dict
+    future: Future
+    locality: Optional[Dict[str, str]] = None
+    attempts: int = 0
+
+
+@dataclass
+class AgentConnection:
+    """Persistent connection to one agent"""
+
+    address: str
+    sock: socket.socket
+    agent_id: str
+    capacity: int
+    labels: Dict[str, str]
+    load: int = 0
+    last_seen: float = field(default_factory=time.monotonic)
+    alive: bool = True
+    tasks: Dict[int, _Task] = field(default_factory=dict)
+    send_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def utilization(self) -> float:
+        # Agent load also counts commands of other coordinators
+        return max(len(self.tasks), self.load) / max(self.capacity, 1)
+
+    def matches(self, locality: Optional[Dict[str, str]]) -> bool:
+        return not locality or all(
+            self.labels.get(key) == value for key, value in locality.items()
+        )
+
+
+class DistributedExecutor:
+    """Class for sharding command execution across agents"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        agents: Optional[List[str]] = None,
+        token: Optional[str] = None,
+        heartbeat_interval: float = 5,
+        heartbeat_timeout: float = 15,
+        max_retries: int = 2,
+        connect_timeout: float = 5,
+    ):
+        self._logger = logger.getChild("DistributedExecutor")
+        self.token = token
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_retries = max_retries
+        self.connect_timeout = connect_timeout
+        self._addresses: List[str] = []
+        self._agents: Dict[str, AgentConnection] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._closed = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+        for address in agents or []:
+            self.register(address)
+
+    # ------------------------------------
+    # Agents
+    # ------------------------------------
+
+    @property
+    def agents(self) -> List[AgentConnection]:
+        with self._lock:
+            return [agent for agent in self._agents.values() if agent.alive]
+
+    def register(self, address: str) -> bool:
+        """
+        Register agent address and connect to it.
+
+        Unreachable agents are retried on every heartbeat.
+
+        Returns:
+            Whether the agent is connected.
+        """
+
+        with self._lock:
+            if address not in self._addresses:
+                self._addresses.append(address)
+
+        if self._heartbeat is None:
+            self._heartbeat = threading.Thread(
+                target=self._heartbeat_loop, name="coordinator-heartbeat", daemon=True
+            )
+            self._heartbeat.start()
+
+        return self._connect(address)
+
+    def _connect(self, address: str) -> bool:
+        try:
+            sock = connect(address, timeout=self.connect_timeout)
+            sock.settimeout(self.connect_timeout)
+            send_frame(sock, {"type": "hello", "token": self.token})
+            welcome = recv_frame(sock)
+            sock.settimeout(None)
+        except (OSError, ValueError, ProtocolError) as e:
+            self._logger.debug("Agent %s is not reachable: %s", address, str(e))
+            return False
+
+        if welcome is None or welcome["type"] != "welcome":
+            self._logger.warning(
+                "Agent %s rejected connection: %s",
+                address,
+                (welcome or {}).get("error", "closed"),
+            )
+            sock.close()
+            return False
+
+        agent = AgentConnection(
+            address=address,
+            sock=sock,
+            agent_id=welcome["agent_id"],
+            capacity=welcome.get("capacity", 1),
+            labels=welcome.get("labels") or {},
+            load=welcome.get("load", 0),
+        )
+        with self._lock:
+            self._agents[address] = agent
+
+        threading.Thread(
+            target=self._read_loop,
+            args=(agent,),
+            name=f"coordinator-{agent.agent_id}",
+            daemon=True,
+        ).start()
+        self._logger.info(
+            "Agent %s connected at %s (capacity=%d)",
+            agent.agent_id,
+            address,
+            agent.capacity,
+        )
+
+        return True
+
+    def _read_loop(self, agent: AgentConnection) -> None:
+        try:
+            while agent.alive:
+                message = recv_frame(agent.sock)
+                if message is None:
+                    break
+                agent.last_seen = time.monotonic()
+                agent.load = message.get("load", agent.load)
+                if message["type"] == "result":
+                    with self._lock:
+                        task = agent.tasks.pop(message["id"], None)
+                    if task is not None and not task.future.done():
+                        task.future.set_result(result_from_dict(message["result"]))
+        except (OSError, ProtocolError, TypeError, ValueError) as e:
+            self._logger.warning("Agent %s connection failed: %s", agent.agent_id, e)
+
+        self._lose(agent)
+
+    def _lose(self, agent: AgentConnection) -> None:
+        """
+        Drop agent and retry its in-flight commands on other agents.
+        """
+
+        with self._lock:
+            if not agent.alive:
+                return
+            agent.alive = False
+            if self._agents.get(agent.address) is agent:
+                del self._agents[agent.address]
+            tasks = list(agent.tasks.values())
+            agent.tasks.clear()
+
+        try:
+            agent.sock.close()
+        except OSError:
+            pass
+
+        if not self._closed.is_set():
+            self._logger.warning(
+                "Agent %s lost with %d commands in flight", agent.agent_id, len(tasks)
+            )
+        for task in tasks:
+            self._retry(task, f"Agent {agent.agent_id} lost")
+
+    def _heartbeat_loop(self) -> None:
+        while not self._closed.wait(self.heartbeat_interval):
+            now = time.monotonic()
+            for agent in self.agents:
+                if now - agent.last_seen > self.heartbeat_timeout:
+                    self._lose(agent)
+                    continue
+                try:
+                    send_frame(agent.sock, {"type": "ping"}, agent.send_lock)
+                except OSError:
+                    self._lose(agent)
+
+            # Reconnect registered agents that are down
+            with self._lock:
+                missing = [a for a in self._addresses if a not in self._agents]
+            for address in missing:
+                self._connect(address)
+
+    # ------------------------------------
+    # Dispatch
+    # ------------------------------------
+
+    def _select(self, locality: Optional[Dict[str, str]]) -> Optional[AgentConnection]:
+        """
+        Select least utilized agent, preferring agents matching locality.
+        """
+
+        agents = self.agents
+        local = [agent for agent in agents if agent.matches(locality)]
+
+        return min(local or agents, key=lambda a: a.utilization, default=None)
+
+    def _dispatch(self, task: _Task) -> None:
+        while True:
+            agent = self._select(task.locality)
+            if agent is None:
+                task.future.set_result(
+                    self._failed(task, "No agents available to execute command")
+                )
+                return
+
+            with self._lock:
+                if not agent.alive:
+                    continue
+                agent.tasks[task.id] = task
+            try:
+                send_frame(
+                    agent.sock,
+                    {"type": "execute", "id": task.id, **task.request},
+                    agent.send_lock,
+                )
+                return
+            except OSError:
+                # _lose retries the task already registered on the agent
+                self._lose(agent)
+                return
+
+    def _retry(self, task: _Task, reason: str) -> None:
+        task.attempts += 1
+        if self._closed.is_set():
+            task.future.set_result(self._failed(task, f"{reason}, executor closed"))
+            return
+        if task.attempts > self.max_retries:
+            task.future.set_result(self._failed(task, f"{reason}, retries exhausted"))
+            return
+
+        self._logger.info(
+            "Retrying %s (attempt %d): %s",
+            task.request["command"],
+            task.attempts + 1,
+            reason,
+        )
+        self._dispatch(task)
+
+    @staticmethod
+    def _failed(task: _Task, reason: str) -> CommandResult:
+        command = task.request["command"]
+        return CommandResult(
+            status=CommandStatus.FAILED,
+            stdout="",
+            stderr=reason,
+            return_code=-1,
+            command=command if isinstance(command, str) else " ".join(command),
+        )
+
+    def submit(
+        self,
+        command: Union[str, List[str]],
+        use_sudo: bool = False,
+        use_shell: bool = False,
+        timeout: int = None,
+        policy: Optional[str] = None,
+        locality: Optional[Dict[str, str]] = None,
+    ) -> "Future[CommandResult]":
+        """
+        Submit command to the least loaded agent.
+
+        Args:
+            command: Command to execute (str or list).
+            use_sudo: Whether to prepend 'sudo'.
+            use_shell: Whether to use shell.
+            timeout: Timeout in seconds (defaults to agent timeout).
+            policy: Resource policy class name on the agent.
+            locality: Agent labels preferred for this command.
+
+        Returns:
+            Future with command result.
+        """
+
+        task = _Task(
+            id=next(self._ids),
+            request={
+                "command": command,
+                "use_sudo": use_sudo,
+                "use_shell": use_shell,
+                "timeout": timeout,
+                "policy": policy,
+                "traceparent": getattr(current_span(), "traceparent", None),
+            },
+            future=Future(),
+            locality=locality,
+        )
+        self._dispatch(task)
+
+        return task.future
+
+    def execute(self, command: Union[str, List[str]], **kwargs) -> CommandResult:
+        """
+        Execute command on an agent and wait for result.
+        """
+
+        return self.submit(command, **kwargs).result()
+
+    def execute_batch(
+        self, commands: Iterable[Union[str, List[str]]], **kwargs
+    ) -> Iterator[Tuple[int, CommandResult]]:
+        """
+        Execute batch of commands across agents.
+
+        Returns:
+            Iterator of (index in batch, result) in completion order.
+        """
+
+        completed: "queue.Queue[Tuple[int, CommandResult]]" = queue.Queue()
+        count = 0
+        for index, command in enumerate(commands):
+            future = self.submit(command, **kwargs)
+            future.add_done_callback(
+                lambda f, index=index: completed.put((index, f.result()))
+            )
+            count += 1
+
+        for _ in range(count):
+            yield completed.get()
+
+    def close(self) -> None:
+        """
+        Close all agent connections.
+        """
+
+        self._closed.set()
+        for agent in self.agents:
+            self._lose(agent)
@@ -0,0 +1,158 @@
+"""
+Framed protocol between coordinator and command agents.
+
+Each frame is a 4-byte big-endian length followed by a JSON object.
+"""
+
+# Imports from standard library
+import json
+import socket
+import struct
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Imports from commander core service
+from app.core.base.commander import CommandResult, CommandStatus
+
+
+# Frame header and size limit
+HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+class ProtocolError(Exception):
+    """Malformed frame or unexpected message"""
+
+
+def parse_address(address: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """
+    Parse agent address.
+
+    Args:
+        address: "unix:/path/to/socket" or "host:port".
+
+    Returns:
+        Socket family and address; TCP addresses get AF_INET, the actual
+        family comes from resolving the host.
+    """
+
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Invalid agent address: {address}")
+
+    return socket.AF_INET, (host.strip("[]"), int(port))
+
+
+def connect(address: str, timeout: Optional[float] = None) -> socket.socket:
+    """
+    Open connection to agent address.
+    """
+
+    family, target = parse_address(address)
+    if family == socket.AF_UNIX:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(target)
+    else:
+        sock = socket.create_connection(target, timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(None)
+
+    return sock
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            return None
+        received += count
+
+    return bytes(buffer)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    Receive one message.
+
+    Returns:
+        Decoded message or None if connection was closed.
+    """
+
+    header = _recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {size} bytes")
+
+    payload = _recv_exactly(sock, size)
+    if payload is None:
+        return None
+
+    try:
+        message = json.loads(payload)
+    except ValueError as e:
+        raise ProtocolError(f"Invalid frame: {e}") from e
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError("Frame is not a message")
+
+    return message
+
+
+def send_frame(
+    sock: socket.socket,
+    message: Dict[str, Any],
+    lock: Optional[threading.Lock] = None,
+) -> None:
+    """
+    Send one message; lock serializes writers sharing the socket.
+
+    Raises:
+        ProtocolError: If message exceeds MAX_FRAME_SIZE (nothing is sent).
+    """
+
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame too large: {len(payload)} bytes")
+
+    data = HEADER.pack(len(payload)) + payload
+    if lock is None:
+        sock.sendall(data)
+        return
+
+    with lock:
+        sock.sendall(data)
+
+
+def result_to_dict(result: CommandResult) -> Dict[str, Any]:
+    """
+    Serialize command result for transfer (TEXT output only).
+    """
+
+    data = asdict(result)
+    data["status"] = result.status.value
+    data.pop("output", None)
+    # Agent-local file, never released by the coordinator
+    data.pop("output_temporary", None)
+
+    return data
+
+
+def result_from_dict(data: Dict[str, Any]) -> CommandResult:
+    """
+    Deserialize command result received from agent.
+    """
+
+    data = dict(data)
+    data["status"] = CommandStatus(data["status"])
+
+    return CommandResult(**data)
@@ -1,5 +1,12 @@
 from .commander import CommandExecutor
-from .enums import CommandStatus
-from .value_objects import CommandResult
+from .enums import CommandStatus, IOPriorityClass, OutputMode
+from .value_objects import CommandResult, ResourcePolicy
 
-__all__ = ["CommandExecutor", "CommandStatus", "CommandResult"]
+__all__ = [
+    "CommandExecutor",
+    "CommandStatus",
+    "IOPriorityClass",
+    "OutputMode",
+    "CommandResult",
+    "ResourcePolicy",
+]
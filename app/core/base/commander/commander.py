@@ -4,19 +4,71 @@ Module for executing commands through subprocess.
 
 import subprocess
 import logging
+import mmap
+import os
 import shlex
-from typing import List, Union
+import tempfile
+from dataclasses import replace
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
-from .value_objects import CommandResult
-from .enums import CommandStatus
+from app.core.base.tracing import Tracer, current_span, span
+
+from .value_objects import CommandResult, ResourcePolicy
+from .enums import CommandStatus, OutputMode
+from .resources import (
+    CgroupManager,
+    MeasuredPopen,
+    apply_priority,
+    build_preexec,
+    detect_violations,
+)
 
 
 class CommandExecutor:
     """Class for executing commands through subprocess"""
 
-    def __init__(self, logger: logging.Logger, timeout: int = 300):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        timeout: int = 300,
+        policies: Optional[Dict[str, dict]] = None,
+        default_policy: Optional[str] = None,
+        cgroup_root: Optional[str] = None,
+        output_dir: Optional[str] = None,
+        tracer: Optional[Tracer] = None,
+    ):
         self._logger = logger.getChild("CommandExecutor")
+        self._tracer = tracer or Tracer()
         self.timeout = timeout
+        self.policies: Dict[str, ResourcePolicy] = {
+            name: ResourcePolicy(**(options or {}))
+            for name, options in (policies or {}).items()
+        }
+        self.default_policy = default_policy
+        self.output_dir = output_dir
+        self._cgroups = CgroupManager(self._logger, cgroup_root)
+
+    def _resolve_policy(
+        self, policy: Union[str, ResourcePolicy, None]
+    ) -> ResourcePolicy:
+        """
+        Resolve policy by class name, falling back to default policy.
+
+        Args:
+            policy: Policy class name, policy object or None.
+
+        Returns:
+            Resource policy.
+        """
+        if isinstance(policy, ResourcePolicy):
+            return policy
+
+        name = policy or self.default_policy
+        if name is None:
+            return ResourcePolicy()
+        if name not in self.policies:
+            raise ValueError(f"Unknown resource policy: {name}")
+        return replace(self.policies[name])
 
     def _prepare_command(
         self,
@@ -54,133 +106,279 @@ class CommandExecutor:
                 return ["sudo"] + cmd_list
             return cmd_list
 
-    def execute(
+    def _open_output(self, output_path: Optional[str]) -> Tuple[BinaryIO, bool]:
+        """
+        Open file receiving command stdout in FILE mode.
+
+        Returns:
+            File object and whether it is a temporary file created here.
+        """
+        if output_path is not None:
+            return open(output_path, "wb"), False
+
+        return (
+            tempfile.NamedTemporaryFile(
+                dir=self.output_dir, prefix="cmd-", suffix=".out", delete=False
+            ),
+            True,
+        )
+
+    @staticmethod
+    def _map_output(output_path: str) -> Tuple[Optional[memoryview], int]:
+        """
+        Map command output file read-only without copying it to the heap.
+        """
+        size = os.path.getsize(output_path)
+        if size == 0:
+            return memoryview(b""), 0
+
+        with open(output_path, "rb") as f:
+            # Mapping stays valid after the file is closed
+            mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+        return memoryview(mapped), size
+
+    def _run(self, command: Union[str, List[str]], *args, **kwargs) -> CommandResult:
+        """
+        Run command within "command" tracing span.
+        """
+
+        with self._tracer.span("command") as command_span:
+            result = self._execute(command, *args, **kwargs)
+            command_span.set_attribute("command", result.command)
+            command_span.set_attribute("status", result.status.value)
+            command_span.set_attribute("return_code", result.return_code)
+            return result
+
+    def _execute(
         self,
         command: Union[str, List[str]],
-        use_sudo: bool = False,
-        use_shell: bool = False,
-        timeout: int = None,
+        use_sudo: bool,
+        use_shell: bool,
+        timeout: Optional[int],
+        policy: Union[str, ResourcePolicy, None],
+        prompt: Optional[str] = None,
+        output: OutputMode = OutputMode.TEXT,
+        output_path: Optional[str] = None,
     ) -> CommandResult:
         """
-        Execute command.
-
-        Args:
-            command: Command to execute (str or list).
-            use_sudo: Whether to prepend 'sudo'.
-            use_shell: Whether to use shell.
-
-        Returns:
-            Command result.
+        Run command under resource policy and collect its result.
         """
 
         if timeout is None:
             timeout = self.timeout
 
+        command_str = command if isinstance(command, str) else " ".join(command)
+        process = None
+        cgroup = None
+        output_file = None
+        is_temporary = False
+
         try:
+            resource_policy = self._resolve_policy(policy)
             cmd = self._prepare_command(command, use_sudo, use_shell)
-            self._logger.debug(f"Executing command: {cmd} (shell={use_shell})")
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                shell=use_shell,
+            self._logger.debug(
+                f"Executing command{' with prompt' if prompt is not None else ''}: "
+                f"{cmd} (shell={use_shell}, output={output.value})"
             )
-            stdout, stderr = process.communicate(timeout=timeout)
+
+            # In FILE mode the child writes stdout straight to the file
+            stdout_target = subprocess.PIPE
+            if output == OutputMode.FILE:
+                output_file, is_temporary = self._open_output(output_path)
+                output_path = output_file.name
+                stdout_target = output_file
+
+            text = output == OutputMode.TEXT
+            stdin_data = None
+            if prompt is not None:
+                stdin_data = prompt + "\n" if text else (prompt + "\n").encode()
+
+            # Propagate trace context to child process
+            env = None
+            active = current_span()
+            if active is not None:
+                env = {**os.environ, "TRACEPARENT": active.traceparent}
+
+            cgroup = self._cgroups.create(resource_policy)
+            try:
+                with span("command.spawn"):
+                    process = MeasuredPopen(
+                        cmd,
+                        stdout=stdout_target,
+                        stderr=subprocess.PIPE,
+                        stdin=subprocess.PIPE if prompt is not None else None,
+                        text=text,
+                        shell=use_shell,
+                        preexec_fn=build_preexec(resource_policy, cgroup),
+                        env=env,
+                    )
+                    try:
+                        apply_priority(process.pid, resource_policy)
+                    except OSError as e:
+                        self._logger.debug(
+                            "Failed to set priority of %s: %s", command_str, str(e)
+                        )
+            finally:
+                if output_file is not None:
+                    output_file.close()
+
+            with span("command.wait"):
+                stdout, stderr = process.communicate(input=stdin_data, timeout=timeout)
             return_code = process.returncode
 
-            status = CommandStatus.SUCCESS if return_code == 0 else CommandStatus.FAILED
+            with span("command.parse"):
+                if not text:
+                    stderr = stderr.decode("utf-8", "replace")
 
-            return CommandResult(
-                status=status,
-                stdout=stdout.strip(),
-                stderr=stderr.strip(),
-                return_code=return_code,
-                command=command if isinstance(command, str) else " ".join(command),
-            )
+                status = (
+                    CommandStatus.SUCCESS if return_code == 0 else CommandStatus.FAILED
+                )
+
+                violations = []
+                if return_code != 0:
+                    violations = detect_violations(
+                        resource_policy,
+                        return_code,
+                        stderr,
+                        oom_killed=(
+                            cgroup is not None and self._cgroups.oom_killed(cgroup)
+                        ),
+                        cpu_time=process.cpu_time,
+                    )
+                    if violations:
+                        status = CommandStatus.LIMIT_EXCEEDED
+                        self._logger.warning(
+                            "Command %s exceeded resource limits: %s",
+                            command_str,
+                            ", ".join(violations),
+                        )
+
+                result = CommandResult(
+                    status=status,
+                    stdout=stdout.strip() if text else "",
+                    stderr=stderr.strip(),
+                    return_code=return_code,
+                    command=command_str,
+                    violations=violations,
+                )
+                if output == OutputMode.BYTES:
+                    result.output = stdout
+                    result.output_size = len(stdout)
+                elif output == OutputMode.FILE:
+                    result.output, result.output_size = self._map_output(output_path)
+                    result.output_path = output_path
+                    result.output_temporary = is_temporary
+
+            return result
 
         except subprocess.TimeoutExpired:
             process.kill()
+            process.communicate()
+            if is_temporary:
+                self._remove_output(output_path)
             return CommandResult(
                 status=CommandStatus.TIMEOUT,
                 stdout="",
                 stderr=f"Command timed out after {timeout} seconds",
                 return_code=-1,
-                command=command if isinstance(command, str) else " ".join(command),
+                command=command_str,
             )
         except Exception as e:
+            if is_temporary:
+                self._remove_output(output_path)
             return CommandResult(
                 status=CommandStatus.FAILED,
                 stdout="",
                 stderr=str(e),
                 return_code=-1,
-                command=command if isinstance(command, str) else " ".join(command),
+                command=command_str,
             )
+        finally:
+            if cgroup is not None:
+                self._cgroups.remove(cgroup)
 
-    def execute_with_prompt(
+    def _remove_output(self, output_path: str) -> None:
+        try:
+            os.remove(output_path)
+        except OSError as e:
+            self._logger.debug("Failed to remove output %s: %s", output_path, str(e))
+
+    def execute(
         self,
         command: Union[str, List[str]],
-        prompt: str,
         use_sudo: bool = False,
         use_shell: bool = False,
         timeout: int = None,
+        policy: Union[str, ResourcePolicy, None] = None,
+        output: OutputMode = OutputMode.TEXT,
+        output_path: Optional[str] = None,
     ) -> CommandResult:
         """
-        Execute command with prompt.
+        Execute command.
 
         Args:
             command: Command to execute (str or list).
-            prompt: Prompt to send to stdin.
             use_sudo: Whether to prepend 'sudo'.
             use_shell: Whether to use shell.
+            timeout: Timeout in seconds (defaults to executor timeout).
+            policy: Resource policy or policy class name.
+            output: Output mode (TEXT, BYTES or FILE).
+            output_path: File for FILE mode (temporary file if not set).
 
         Returns:
-            Command result.
+            Command result. In FILE mode the caller owns the output mapping
+            and temporary file: call result.release() (or use the result as
+            a context manager) when done with it.
         """
 
-        if timeout is None:
-            timeout = self.timeout
+        return self._run(
+            command,
+            use_sudo,
+            use_shell,
+            timeout,
+            policy,
+            output=output,
+            output_path=output_path,
+        )
 
-        try:
-            cmd = self._prepare_command(command, use_sudo, use_shell)
-            self._logger.debug(
-                f"Executing command with prompt: {cmd} (shell={use_shell})"
-            )
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
-                text=True,
-                shell=use_shell,
-            )
-            stdout, stderr = process.communicate(input=prompt + "\n", timeout=timeout)
-            return_code = process.returncode
+    def execute_with_prompt(
+        self,
+        command: Union[str, List[str]],
+        prompt: str,
+        use_sudo: bool = False,
+        use_shell: bool = False,
+        timeout: int = None,
+        policy: Union[str, ResourcePolicy, None] = None,
+        output: OutputMode = OutputMode.TEXT,
+        output_path: Optional[str] = None,
+    ) -> CommandResult:
+        """
+        Execute command with prompt.
 
-            status = CommandStatus.SUCCESS if return_code == 0 else CommandStatus.FAILED
+        Args:
+            command: Command to execute (str or list).
+            prompt: Prompt to send to stdin.
+            use_sudo: Whether to prepend 'sudo'.
+            use_shell: Whether to use shell.
+            timeout: Timeout in seconds (defaults to executor timeout).
+            policy: Resource policy or policy class name.
+            output: Output mode (TEXT, BYTES or FILE).
+            output_path: File for FILE mode (temporary file if not set).
 
-            return CommandResult(
-                status=status,
-                stdout=stdout.strip(),
-                stderr=stderr.strip(),
-                return_code=return_code,
-                command=command if isinstance(command, str) else " ".join(command),
-            )
+        Returns:
+            Command result. In FILE mode the caller owns the output mapping
+            and temporary file: call result.release() (or use the result as
+            a context manager) when done with it.
+        """
 
-        except subprocess.TimeoutExpired:
-            process.kill()
-            return CommandResult(
-                status=CommandStatus.TIMEOUT,
-                stdout="",
-                stderr=f"Command timed out after {timeout} seconds",
-                return_code=-1,
-                command=command if isinstance(command, str) else " ".join(command),
-            )
-        except Exception as e:
-            return CommandResult(
-                status=CommandStatus.FAILED,
-                stdout="",
-                stderr=str(e),
-                return_code=-1,
-                command=command if isinstance(command, str) else " ".join(command),
-            )
+        return self._run(
+            command,
+            use_sudo,
+            use_shell,
+            timeout,
+            policy,
+            prompt=prompt,
+            output=output,
+            output_path=output_path,
+        )
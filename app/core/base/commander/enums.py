@@ -17,3 +17,23 @@ class CommandStatus(Enum):
     SUCCESS = "SUCCESS"
     FAILED = "FAILED"
     TIMEOUT = "TIMEOUT"
+    LIMIT_EXCEEDED = "LIMIT_EXCEEDED"
+
+
+class OutputMode(Enum):
+    """Command stdout handling modes"""
+
+    # Decoded and stripped str in CommandResult.stdout
+    TEXT = "TEXT"
+    # Raw bytes in CommandResult.output
+    BYTES = "BYTES"
+    # Written by the child directly to a file, mapped into CommandResult.output
+    FILE = "FILE"
+
+
+class IOPriorityClass(Enum):
+    """Linux I/O scheduling classes (ionice)"""
+
+    REALTIME = 1
+    BEST_EFFORT = 2
+    IDLE = 3
@@ -0,0 +1,310 @@
+"""
+Module for applying resource policies to executed commands.
+"""
+
+# Imports from standard library
+import ctypes
+import logging
+import os
+import platform
+import signal
+import subprocess
+import uuid
+from pathlib import Path
+from typing import Callable, List, Optional
+
+# Imports from local modules
+from .value_objects import ResourcePolicy
+
+
+# Resource module is not available on every platform
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+# ioprio_set syscall numbers per architecture
+_IOPRIO_SET_SYSCALLS = {
+    "x86_64": 251,
+    "aarch64": 30,
+    "i386": 289,
+    "i686": 289,
+}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_SHIFT = 13
+
+# cgroup v2 cpu.max period in microseconds
+_CPU_PERIOD = 100000
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    try:
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+
+_LIBC = _load_libc()
+
+
+def build_preexec(
+    policy: ResourcePolicy, cgroup: Optional[Path] = None
+) -> Optional[Callable[[], None]]:
+    """
+    Build function applying rlimits and cgroup in child process before exec.
+
+    Rlimits and cgroup membership must be in place before exec: applied from
+    the parent after spawn, the command and children it forks first would
+    run unconstrained. Priorities are applied from the parent by
+    apply_priority(), so commands without rlimits or cgroup caps keep the
+    fast spawn path without preexec_fn.
+
+    Args:
+        policy: Resource policy.
+        cgroup: cgroup directory to move the child into.
+
+    Returns:
+        Function for Popen preexec_fn or None if nothing to apply.
+    """
+
+    limits = []
+    if RESOURCE_AVAILABLE:
+        if policy.max_memory is not None:
+            limits.append((resource.RLIMIT_AS, policy.max_memory, policy.max_memory))
+        if policy.max_cpu_time is not None:
+            # Soft limit sends SIGXCPU, hard limit one second later SIGKILL
+            limits.append(
+                (resource.RLIMIT_CPU, policy.max_cpu_time, policy.max_cpu_time + 1)
+            )
+        if policy.max_open_files is not None:
+            limits.append(
+                (resource.RLIMIT_NOFILE, policy.max_open_files, policy.max_open_files)
+            )
+
+    procs = str(cgroup / "cgroup.procs") if cgroup is not None else None
+
+    if not (limits or procs):
+        return None
+
+    # Runs between fork and exec, where locks held by other threads at fork
+    # time stay locked forever: only raw syscalls here (os.open/os.write, not
+    # buffered open()), no logging, no imports, failures are ignored
+    def preexec() -> None:
+        if procs is not None:
+            try:
+                fd = os.open(procs, os.O_WRONLY)
+                try:
+                    os.write(fd, b"%d" % os.getpid())
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+        for limit, soft, hard in limits:
+            try:
+                current_hard = resource.getrlimit(limit)[1]
+                if current_hard != resource.RLIM_INFINITY:
+                    soft, hard = min(soft, current_hard), min(hard, current_hard)
+                resource.setrlimit(limit, (soft, hard))
+            except (OSError, ValueError):
+                pass
+
+    return preexec
+
+
+def apply_priority(pid: int, policy: ResourcePolicy) -> None:
+    """
+    Apply policy nice and ionice to started process.
+
+    Children the command forks before this call keep the default priority;
+    the process itself and later children are reprioritized.
+
+    Args:
+        pid: Process id.
+        policy: Resource policy.
+
+    Raises:
+        OSError: If priority could not be changed.
+    """
+
+    if policy.nice:
+        base = os.getpriority(os.PRIO_PROCESS, 0)
+        os.setpriority(os.PRIO_PROCESS, pid, base + policy.nice)
+
+    ioprio_syscall = _IOPRIO_SET_SYSCALLS.get(platform.machine())
+    if policy.ionice_class is not None and ioprio_syscall and _LIBC is not None:
+        ioprio = (policy.ionice_class.value << _IOPRIO_CLASS_SHIFT) | (
+            policy.ionice_level & 0x7
+        )
+        if _LIBC.syscall(ioprio_syscall, _IOPRIO_WHO_PROCESS, pid, ioprio) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+
+class CgroupManager:
+    """Class for creating per-command cgroup v2 slices"""
+
+    def __init__(self, logger: logging.Logger, root: Optional[str] = None):
+        self._logger = logger.getChild("CgroupManager")
+        self.root = Path(root) if root else None
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """
+        Check cgroup v2 root is present and writable, enabling controllers once.
+        """
+
+        if self._available is None:
+            self._available = self._setup()
+
+        return self._available
+
+    def _setup(self) -> bool:
+        if self.root is None:
+            return False
+
+        if not Path("/sys/fs/cgroup/cgroup.controllers").exists():
+            self._logger.warning("cgroup v2 is not available, caps are disabled")
+            return False
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            (self.root / "cgroup.subtree_control").write_text("+cpu +memory")
+        except OSError as e:
+            self._logger.warning(
+                "cgroup root %s is not writable, caps are disabled: %s",
+                self.root,
+                str(e),
+            )
+            return False
+
+        return True
+
+    def create(self, policy: ResourcePolicy) -> Optional[Path]:
+        """
+        Create cgroup for one command with policy caps.
+
+        Returns:
+            cgroup directory or None if cgroups are not available.
+        """
+
+        if not policy.uses_cgroup or not self.available:
+            return None
+
+        path = self.root / f"cmd-{uuid.uuid4().hex[:12]}"
+        try:
+            path.mkdir()
+            if policy.cpu_max is not None:
+                quota = max(1000, int(policy.cpu_max * _CPU_PERIOD))
+                (path / "cpu.max").write_text(f"{quota} {_CPU_PERIOD}")
+            if policy.memory_max is not None:
+                (path / "memory.max").write_text(str(policy.memory_max))
+                (path / "memory.swap.max").write_text("0")
+        except OSError as e:
+            self._logger.warning("Failed to create cgroup %s: %s", path, str(e))
+            self.remove(path)
+            return None
+
+        return path
+
+    def oom_killed(self, path: Path) -> bool:
+        """
+        Check whether memory.max OOM killer fired in cgroup.
+        """
+
+        try:
+            for line in (path / "memory.events").read_text().splitlines():
+                key, _, value = line.partition(" ")
+                if key == "oom_kill" and int(value) > 0:
+                    return True
+        except (OSError, ValueError):
+            pass
+
+        return False
+
+    def remove(self, path: Path) -> None:
+        try:
+            path.rmdir()
+        except OSError as e:
+            # Descendants of the command may still be alive
+            self._logger.debug("Failed to remove cgroup %s: %s", path, str(e))
+
+
+class MeasuredPopen(subprocess.Popen):
+    """Popen reaping its child with wait4 to keep the child's own rusage"""
+
+    rusage = None
+
+    def _try_wait(self, wait_flags):
+        # Same contract as Popen._try_wait, which every wait path goes through
+        if not hasattr(os, "wait4"):
+            return super()._try_wait(wait_flags)
+        try:
+            pid, status, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            return self.pid, 0
+        if pid == self.pid:
+            self.rusage = rusage
+        return pid, status
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        """
+        CPU seconds used by the reaped child (None before it is reaped).
+        """
+
+        if self.rusage is None:
+            return None
+
+        return self.rusage.ru_utime + self.rusage.ru_stime
+
+
+def detect_violations(
+    policy: ResourcePolicy,
+    return_code: int,
+    stderr: str,
+    oom_killed: bool = False,
+    cpu_time: Optional[float] = None,
+) -> List[str]:
+    """
+    Detect which policy limits the command ran into.
+
+    Args:
+        policy: Resource policy.
+        return_code: Command return code.
+        stderr: Command stderr.
+        oom_killed: Whether cgroup OOM killer fired.
+        cpu_time: CPU seconds used by the command (MeasuredPopen.cpu_time).
+
+    Returns:
+        List of violated limits ("cpu_time", "memory", "open_files").
+    """
+
+    violations = []
+
+    # SIGKILL is the RLIMIT_CPU hard limit only if the CPU time got there,
+    # otherwise the command was killed externally
+    if policy.max_cpu_time is not None and (
+        return_code == -signal.SIGXCPU
+        or (
+            return_code == -signal.SIGKILL
+            and not oom_killed
+            and cpu_time is not None
+            and cpu_time >= policy.max_cpu_time
+        )
+    ):
+        violations.append("cpu_time")
+
+    if oom_killed or (
+        policy.max_memory is not None
+        and ("MemoryError" in stderr or "Cannot allocate memory" in stderr)
+    ):
+        violations.append("memory")
+
+    if policy.max_open_files is not None and "Too many open files" in stderr:
+        violations.append("open_files")
+
+    return violations
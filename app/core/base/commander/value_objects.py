@@ -3,10 +3,13 @@ Models for working with commands.
 """
 
 # Imports from standard library
-from dataclasses import dataclass
+import mmap
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
 
 # Imports from enums
-from .enums import CommandStatus
+from .enums import CommandStatus, IOPriorityClass
 
 
 # ------------------------------------
@@ -23,3 +26,66 @@ class CommandResult:
     stderr: str
     return_code: int
     command: str
+    violations: List[str] = field(default_factory=list)
+    # Raw stdout for BYTES (bytes) and FILE (memoryview over mmap) modes
+    output: Optional[Union[bytes, memoryview]] = field(default=None, repr=False)
+    output_path: Optional[str] = None
+    output_size: Optional[int] = None
+    # Whether output_path is a temporary file owned by this result
+    output_temporary: bool = field(default=False, repr=False)
+
+    def release(self) -> None:
+        """
+        Release FILE mode output: close mapping and remove temporary file.
+
+        Views sliced from output must be released before.
+        """
+
+        output, self.output = self.output, None
+        if isinstance(output, memoryview):
+            mapped = output.obj
+            output.release()
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+        if self.output_temporary and self.output_path:
+            try:
+                os.remove(self.output_path)
+            except FileNotFoundError:
+                pass
+            self.output_temporary = False
+
+    def __enter__(self) -> "CommandResult":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+@dataclass
+class ResourcePolicy:
+    """Resource limits applied to executed command"""
+
+    # CPU niceness increment (os.nice)
+    nice: int = 0
+    # I/O scheduling class and level 0-7 (ionice)
+    ionice_class: Optional[Union[IOPriorityClass, str]] = None
+    ionice_level: int = 4
+    # setrlimit limits: address space bytes, CPU seconds, open files
+    max_memory: Optional[int] = None
+    max_cpu_time: Optional[int] = None
+    max_open_files: Optional[int] = None
+    # cgroup v2 caps: number of CPUs (cpu.max) and bytes (memory.max)
+    cpu_max: Optional[float] = None
+    memory_max: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Allow class names from configuration ("best-effort", "idle", ...)
+        if isinstance(self.ionice_class, str):
+            self.ionice_class = IOPriorityClass[
+                self.ionice_class.upper().replace("-", "_")
+            ]
+
+    @property
+    def uses_cgroup(self) -> bool:
+        return self.cpu_max is not None or self.memory_max is not None
@@ -47,17 +47,17 @@ def _find_project_root() -> str:
     )
 
 
-# Define Logger core service
-def _init_logger(configuration: providers.Configuration) -> providers.Singleton:
+# Define Log configuration core service
+def _init_log_config(configuration: providers.Configuration) -> providers.Singleton:
     """
-    Initialize Singleton logger core service
+    Initialize Singleton log configuration shared by logger and log reader
     """
 
     # Imports from logger core service package
-    from app.core.base.logger import LogConfig, get_logger
+    from app.core.base.logger import LogConfig
 
-    # Register logger provider
-    logger_configuration = providers.Factory(
+    # Create and return log configuration provider
+    return providers.Singleton(
         LogConfig,
         level=configuration.logging.level,
         handlers=configuration.logging.handlers,
@@ -67,14 +67,69 @@ def _init_logger(configuration: providers.Configuration) -> providers.Singleton:
         use_colors=configuration.logging.use_colors,
     )
 
+
+# Define Logger core service
+def _init_logger(log_config: providers.Singleton) -> providers.Singleton:
+    """
+    Initialize Singleton logger core service
+    """
+
+    # Imports from logger core service package
+    from app.core.base.logger import get_logger
+
     # Create and return logger provider
-    return providers.Singleton(get_logger, logger_configuration)
+    return providers.Singleton(get_logger, log_config)
+
+
+# Define Tracer core service
+def _init_tracer(
+    configuration: providers.Configuration,
+    logger: providers.Singleton,
+) -> providers.Singleton:
+    """
+    Initialize Singleton tracer core service
+    """
+
+    # Imports from tracing core service package
+    from app.core.base.tracing import get_tracer
+
+    # Create and return tracer provider
+    return providers.Singleton(
+        get_tracer,
+        logger=logger,
+        sample_rate=configuration.tracing.sample_rate,
+        ring_size=configuration.tracing.ring_size,
+        file_path=configuration.tracing.file_path,
+    )
+
+
+# Define Log reader core service
+def _init_log_reader(
+    configuration: providers.Configuration,
+    logger: providers.Singleton,
+    log_config: providers.Singleton,
+) -> providers.Singleton:
+    """
+    Initialize Singleton log reader core service
+    """
+
+    # Imports from logger core service package
+    from app.core.base.logger import LogReader
+
+    # Create and return log reader provider (same resolved config as writer)
+    return providers.Singleton(
+        LogReader.from_config,
+        logger=logger,
+        config=log_config,
+        stride=configuration.logging.index_stride,
+    )
 
 
 # Define Commander core service:
 def _init_commander(
     configuration: providers.Configuration,
     logger: providers.Singleton,
+    tracer: providers.Singleton,
 ) -> providers.Singleton:
     """
     Initialize Singleton commander core service
@@ -88,6 +143,109 @@ def _init_commander(
         CommandExecutor,
         logger=logger,
         timeout=configuration.commander.timeout,
+        policies=configuration.commander.policies,
+        default_policy=configuration.commander.default_policy,
+        cgroup_root=configuration.commander.cgroup_root,
+        output_dir=configuration.commander.output_dir,
+        tracer=tracer,
+    )
+
+
+# Define Scheduler core service
+def _init_scheduler(
+    configuration: providers.Configuration,
+    logger: providers.Singleton,
+    commander: providers.Singleton,
+    tracer: providers.Singleton,
+) -> providers.Singleton:
+    """
+    Initialize Singleton scheduler core service
+    """
+
+    # Imports from scheduler core service package
+    from app.core.base.scheduler import CommandScheduler
+
+    # Create and return scheduler provider
+    return providers.Singleton(
+        CommandScheduler,
+        logger=logger,
+        commander=commander,
+        max_workers=configuration.scheduler.max_workers,
+        schedules=configuration.scheduler.schedules,
+        tracer=tracer,
+    )
+
+
+# Define Agent core service
+def _init_agent(
+    configuration: providers.Configuration,
+    logger: providers.Singleton,
+    commander: providers.Singleton,
+    tracer: providers.Singleton,
+) -> providers.Singleton:
+    """
+    Initialize Singleton agent core service
+    """
+
+    # Imports from agent core service package
+    from app.core.base.agent import CommandAgent
+
+    # Create and return agent provider
+    return providers.Singleton(
+        CommandAgent,
+        logger=logger,
+        commander=commander,
+        address=configuration.agent.address,
+        agent_id=configuration.agent.id,
+        capacity=configuration.agent.capacity,
+        labels=configuration.agent.labels,
+        token=configuration.agent.token,
+        allow_sudo=configuration.agent.allow_sudo,
+        tracer=tracer,
+    )
+
+
+# Define Distributed executor core service
+def _init_distributed_executor(
+    configuration: providers.Configuration,
+    logger: providers.Singleton,
+) -> providers.Singleton:
+    """
+    Initialize Singleton distributed executor core service
+    """
+
+    # Imports from agent core service package
+    from app.core.base.agent import DistributedExecutor
+
+    # Create and return distributed executor provider
+    return providers.Singleton(
+        DistributedExecutor,
+        logger=logger,
+        agents=configuration.coordinator.agents,
+        token=configuration.agent.token,
+        heartbeat_interval=configuration.coordinator.heartbeat_interval,
+        heartbeat_timeout=configuration.coordinator.heartbeat_timeout,
+        max_retries=configuration.coordinator.max_retries,
+        connect_timeout=configuration.coordinator.connect_timeout,
+    )
+
+
+# Define API response cache core service
+def _init_response_cache(
+    configuration: providers.Configuration,
+) -> providers.Singleton:
+    """
+    Initialize Singleton API response cache core service
+    """
+
+    # Imports from API server package
+    from app.api.server.cache import ResponseCache
+
+    # Create and return response cache provider
+    return providers.Singleton(
+        ResponseCache,
+        max_bytes=configuration.api.cache.max_bytes,
+        max_entries=configuration.api.cache.max_entries,
     )
 
 
@@ -95,6 +253,8 @@ def _init_commander(
 def _init_api_server(
     configuration: providers.Configuration,
     logger: providers.Singleton,
+    response_cache: providers.Singleton,
+    tracer: providers.Singleton,
 ) -> providers.Singleton:
     """
     Initialize Singleton API server core service
@@ -105,6 +265,8 @@ def _init_api_server(
         API,
         logger=logger,
         configuration=configuration,
+        response_cache=response_cache,
+        tracer=tracer,
     )
 
 
@@ -126,11 +288,32 @@ class Container(containers.DeclarativeContainer):
     # Configuration provider
     configuration = providers.Configuration()
 
+    # Singleton log configuration
+    log_config = _init_log_config(configuration)
+
     # Singleton logger
-    logger = _init_logger(configuration)
+    logger = _init_logger(log_config)
+
+    # Singleton tracer
+    tracer = _init_tracer(configuration, logger)
+
+    # Singleton log reader
+    log_reader = _init_log_reader(configuration, logger, log_config)
 
     # Singleton commander
-    commander = _init_commander(configuration, logger)
+    commander = _init_commander(configuration, logger, tracer)
+
+    # Singleton scheduler
+    scheduler = _init_scheduler(configuration, logger, commander, tracer)
+
+    # Singleton agent
+    agent = _init_agent(configuration, logger, commander, tracer)
+
+    # Singleton distributed executor
+    distributed_executor = _init_distributed_executor(configuration, logger)
+
+    # Singleton API response cache
+    response_cache = _init_response_cache(configuration)
 
     # Singleton API server
-    api_server = _init_api_server(configuration, logger)
+    api_server = _init_api_server(configuration, logger, response_cache, tracer)
@@ -1,4 +1,5 @@
 from .logger import get_logger
-from .value_objects import LogConfig
+from .query import LogReader
+from .value_objects import LogConfig, LogEntry, LogQuery
 
-__all__ = ["get_logger", "LogConfig"]
+__all__ = ["get_logger", "LogReader", "LogConfig", "LogEntry", "LogQuery"]
@@ -0,0 +1,65 @@
+"""
+Command line interface for querying log files.
+
+Usage:
+    python -m app.core.base.logger --since "2025-05-30 10:00:00" \\
+        --level WARNING --logger CommandExecutor --contains sudo
+"""
+
+# Imports from standard library
+import argparse
+import sys
+from datetime import datetime
+
+# Imports from local modules
+from .query import LogReader
+from .value_objects import LogQuery
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def main(argv=None) -> int:
+    """
+    Query log records and print them to stdout.
+    """
+
+    parser = argparse.ArgumentParser(description="Query application log files")
+    parser.add_argument("--since", type=_parse_datetime, help="Start of time range")
+    parser.add_argument("--until", type=_parse_datetime, help="End of time range")
+    parser.add_argument("--level", help="Minimum log level")
+    parser.add_argument("--logger", help="Logger name (e.g. CommandExecutor)")
+    parser.add_argument("--contains", help="Substring to search in message")
+    parser.add_argument("--limit", type=int, help="Maximum number of records")
+    args = parser.parse_args(argv)
+
+    # Imports from core application
+    from app.core.application.application import init_container
+
+    reader: LogReader = init_container().log_reader()
+    query = LogQuery(
+        start=args.since,
+        end=args.until,
+        level=args.level,
+        logger=args.logger,
+        contains=args.contains,
+        limit=args.limit,
+    )
+
+    try:
+        for entry in reader.query(query):
+            sys.stdout.write(
+                f"[{entry.timestamp:%Y-%m-%d %H:%M:%S}] {entry.level} "
+                f"{entry.logger}: {entry.message}\n"
+            )
+    except ValueError as e:
+        parser.error(str(e))
+    except BrokenPipeError:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
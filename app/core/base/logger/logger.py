@@ -10,6 +10,9 @@ from typing import Optional
 import logging
 from logging.handlers import RotatingFileHandler
 
+# Imports from tracing core service
+from app.core.base.tracing import TraceContextFilter
+
 # Imports from local modules
 from .value_objects import LogConfig
 
@@ -128,4 +131,9 @@ def get_logger(config: Optional[LogConfig] = None, **kwargs) -> logging.Logger:
             # Add handler to logger
             logger.addHandler(fh)
 
+    # Add trace ids so format may use %(trace_id)s and %(span_id)s
+    for handler in logger.handlers:
+        if not any(isinstance(f, TraceContextFilter) for f in handler.filters):
+            handler.addFilter(TraceContextFilter())
+
     return logger
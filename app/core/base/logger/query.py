@@ -0,0 +1,496 @@
+"""
+Module for querying log files written by the logger core service.
+"""
+
+# Imports from standard library
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Imports from third party libraries
+import logging
+
+# Imports from local modules
+from .value_objects import LogConfig, LogEntry, LogQuery
+
+
+# Openers for compressed rotated segments
+COMPRESSED_OPENERS: Dict[str, Callable] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+# Default format used by get_logger when none is configured
+DEFAULT_LOG_FORMAT = "[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s"
+DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Regex fragments for known LogRecord attributes
+_FIELD_PATTERNS = {
+    "asctime": r"(?P<asctime>.+?)",
+    "levelname": r"(?P<levelname>[A-Z]+)",
+    "name": r"(?P<name>[^\n]+?)",
+    "message": r"(?P<message>[^\n]*)",
+}
+
+_FORMAT_FIELD = re.compile(r"%\((\w+)\)[-#0 +]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]")
+
+
+def compile_format(fmt: str) -> "re.Pattern[bytes]":
+    """
+    Compile logging format string to bytes regex matching record header lines.
+
+    Args:
+        fmt: Logging format string (%-style).
+
+    Returns:
+        Compiled multiline regex.
+    """
+
+    parts = []
+    position = 0
+    seen = set()
+    for match in _FORMAT_FIELD.finditer(fmt):
+        parts.append(re.escape(fmt[position : match.start()]))
+        name = match.group(1)
+        if name in _FIELD_PATTERNS and name not in seen:
+            parts.append(_FIELD_PATTERNS[name])
+            seen.add(name)
+        else:
+            parts.append(r"[^\n]*?")
+        position = match.end()
+    parts.append(re.escape(fmt[position:]))
+
+    if "asctime" not in seen:
+        raise ValueError(f"Log format has no %(asctime)s field: {fmt}")
+
+    return re.compile(("^" + "".join(parts) + "$").encode(), re.MULTILINE)
+
+
+@dataclass
+class SegmentIndex:
+    """
+    Sparse index of one log segment: timestamp -> byte offset.
+    """
+
+    path: str
+    key: Tuple[int, int]
+    compressed: bool
+    indexed_size: int = 0
+    entries: List[Tuple[float, int]] = field(default_factory=list)
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+
+    def seek_offset(self, start_ts: Optional[float]) -> int:
+        """
+        Get offset of the last indexed record strictly before start_ts.
+        """
+
+        if start_ts is None or not self.entries:
+            return 0
+
+        low, high = 0, len(self.entries)
+        while low < high:
+            middle = (low + high) // 2
+            if self.entries[middle][0] < start_ts:
+                low = middle + 1
+            else:
+                high = middle
+
+        return self.entries[low - 1][1] if low > 0 else 0
+
+
+class LogReader:
+    """Class for querying rotated log files through a sparse index"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        path: str = "logs",
+        name: str = "app.log",
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        stride: int = 64 * 1024,
+    ):
+        self._logger = logger.getChild("LogReader")
+        self.path = path
+        self.name = name
+        self.datefmt = datefmt or DEFAULT_DATE_FORMAT
+        self.stride = stride
+        self._pattern = compile_format(fmt or DEFAULT_LOG_FORMAT)
+        self._indexes: Dict[Tuple[int, int], SegmentIndex] = {}
+        self._lock = threading.Lock()
+        self._ts_cache: Dict[bytes, float] = {}
+
+    @classmethod
+    def from_config(
+        cls, logger: logging.Logger, config: LogConfig, stride: int = 64 * 1024
+    ) -> "LogReader":
+        """
+        Create reader of the file written by get_logger() with the same config.
+        """
+
+        file_config = config.file_config or {}
+        return cls(
+            logger,
+            path=file_config.get("path", "logs"),
+            name=file_config.get("name", f"{config.name}.log"),
+            fmt=config.fmt,
+            datefmt=config.datefmt,
+            stride=stride or 64 * 1024,
+        )
+
+    # ------------------------------------
+    # Segments
+    # ------------------------------------
+
+    def segments(self) -> List[str]:
+        """
+        Get segment paths in chronological order (oldest first).
+        """
+
+        try:
+            files = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+
+        rotated = []
+        prefix = self.name + "."
+        for file_name in files:
+            if not file_name.startswith(prefix):
+                continue
+            suffix = file_name[len(prefix) :]
+            number, _, extension = suffix.partition(".")
+            if not number.isdigit():
+                continue
+            if extension and "." + extension not in COMPRESSED_OPENERS:
+                continue
+            rotated.append((int(number), os.path.join(self.path, file_name)))
+
+        result = [path for _, path in sorted(rotated, reverse=True)]
+        current = os.path.join(self.path, self.name)
+        if os.path.exists(current):
+            result.append(current)
+
+        return result
+
+    def _parse_ts(self, asctime: bytes) -> Optional[float]:
+        """
+        Parse record timestamp, caching repeated values.
+
+        Returns:
+            Timestamp or None if asctime does not match datefmt (the line only
+            looks like a record header, e.g. command output in a message).
+        """
+
+        try:
+            return self._ts_cache[asctime]
+        except KeyError:
+            pass
+
+        try:
+            ts = datetime.strptime(
+                asctime.decode("utf-8", "replace"), self.datefmt
+            ).timestamp()
+        except ValueError:
+            ts = None
+        if len(self._ts_cache) > 4096:
+            self._ts_cache.clear()
+        self._ts_cache[asctime] = ts
+
+        return ts
+
+    def _headers(
+        self, mm: mmap.mmap, offset: int
+    ) -> Iterator[Tuple["re.Match[bytes]", float]]:
+        """
+        Iterate record headers from offset, skipping lookalike lines.
+        """
+
+        for match in self._pattern.finditer(mm, offset):
+            ts = self._parse_ts(match.group("asctime"))
+            if ts is not None:
+                yield match, ts
+
+    # ------------------------------------
+    # Index
+    # ------------------------------------
+
+    def index(self, segment: str) -> Optional[SegmentIndex]:
+        """
+        Get sparse index of segment, building or extending it as needed.
+
+        Indexes are keyed by inode so rotation (rename) keeps them valid.
+        """
+
+        try:
+            stat = os.stat(segment)
+        except FileNotFoundError:
+            return None
+
+        key = (stat.st_dev, stat.st_ino)
+        compressed = os.path.splitext(segment)[1] in COMPRESSED_OPENERS
+
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None or stat.st_size < index.indexed_size:
+                index = SegmentIndex(path=segment, key=key, compressed=compressed)
+                self._indexes[key] = index
+            index.path = segment
+
+            if stat.st_size > index.indexed_size and not (
+                index.compressed and index.indexed_size
+            ):
+                try:
+                    if index.compressed:
+                        self._index_compressed(index, stat.st_size)
+                    else:
+                        self._index_plain(index, stat.st_size)
+                except (OSError, EOFError, ValueError) as e:
+                    self._logger.warning("Failed to index %s: %s", segment, str(e))
+                    return None
+
+        return index
+
+    def _prune(self, segments: List[str]) -> None:
+        """
+        Drop indexes of segments removed by rotation.
+        """
+
+        live = set()
+        for segment in segments:
+            try:
+                stat = os.stat(segment)
+            except FileNotFoundError:
+                continue
+            live.add((stat.st_dev, stat.st_ino))
+
+        with self._lock:
+            for stale in set(self._indexes) - live:
+                del self._indexes[stale]
+
+    def _index_plain(self, index: SegmentIndex, size: int) -> None:
+        """
+        Extend index of plain segment by sampling a record every stride bytes.
+        """
+
+        with open(index.path, "rb") as f, mmap.mmap(
+            f.fileno(), size, access=mmap.ACCESS_READ
+        ) as mm:
+            offset = index.entries[-1][1] + self.stride if index.entries else 0
+            while offset < size:
+                header = next(self._headers(mm, offset), None)
+                if header is None:
+                    break
+                match, ts = header
+                if not index.entries or match.start() > index.entries[-1][1]:
+                    index.entries.append((ts, match.start()))
+                offset = max(match.end(), offset + self.stride)
+
+            # Last record timestamp within the tail stride
+            tail = index.entries[-1][1] if index.entries else 0
+            for _, ts in self._headers(mm, tail):
+                index.last_ts = ts
+
+        if index.entries:
+            index.first_ts = index.entries[0][0]
+        index.indexed_size = size
+
+    def _index_compressed(self, index: SegmentIndex, size: int) -> None:
+        """
+        Index compressed segment once; offsets refer to decompressed stream.
+        """
+
+        opener = COMPRESSED_OPENERS[os.path.splitext(index.path)[1]]
+        next_offset = 0
+        offset = 0
+        with opener(index.path, "rb") as f:
+            for line in f:
+                match = self._pattern.match(line)
+                ts = self._parse_ts(match.group("asctime")) if match else None
+                if ts is not None:
+                    if offset >= next_offset:
+                        index.entries.append((ts, offset))
+                        next_offset = offset + self.stride
+                    index.last_ts = ts
+                offset += len(line)
+
+        if index.entries:
+            index.first_ts = index.entries[0][0]
+        index.indexed_size = size
+
+    # ------------------------------------
+    # Query
+    # ------------------------------------
+
+    def query(self, query: Optional[LogQuery] = None, **kwargs) -> Iterator[LogEntry]:
+        """
+        Query log records across all segments in chronological order.
+
+        Args:
+            query: Query filters (or pass LogQuery fields as kwargs).
+
+        Returns:
+            Iterator of matching log entries.
+        """
+
+        query = query or LogQuery(**kwargs)
+        start_ts = query.start.timestamp() if query.start else None
+        end_ts = query.end.timestamp() if query.end else None
+        min_level = (
+            logging.getLevelName(query.level.upper()) if query.level else None
+        )
+        if min_level is not None and not isinstance(min_level, int):
+            raise ValueError(f"Unknown log level: {query.level}")
+
+        logger_needle = f".{query.logger}.".encode() if query.logger else None
+        contains = query.contains.encode() if query.contains else None
+        level_cache: Dict[bytes, int] = {}
+
+        def accept(levelname: bytes, name: bytes, text: bytes) -> bool:
+            if min_level is not None:
+                level = level_cache.get(levelname)
+                if level is None:
+                    level = logging.getLevelName(levelname.decode())
+                    level = level if isinstance(level, int) else logging.NOTSET
+                    level_cache[levelname] = level
+                if level < min_level:
+                    return False
+            if logger_needle is not None and logger_needle not in b"." + name + b".":
+                return False
+            if contains is not None and contains not in text:
+                return False
+            return True
+
+        count = 0
+        segments = self.segments()
+        self._prune(segments)
+        for segment in segments:
+            index = self.index(segment)
+            if index is None or index.first_ts is None:
+                continue
+            if start_ts is not None and index.last_ts < start_ts:
+                continue
+            if end_ts is not None and index.first_ts > end_ts:
+                continue
+
+            scan = self._scan_compressed if index.compressed else self._scan_plain
+            for ts, offset, levelname, name, text in scan(
+                index, index.seek_offset(start_ts)
+            ):
+                if start_ts is not None and ts < start_ts:
+                    continue
+                if end_ts is not None and ts > end_ts:
+                    return
+                if not accept(levelname, name, text):
+                    continue
+
+                yield LogEntry(
+                    timestamp=datetime.fromtimestamp(ts),
+                    level=levelname.decode(),
+                    logger=name.decode("utf-8", "replace"),
+                    message=text.decode("utf-8", "replace"),
+                    segment=os.path.basename(index.path),
+                    offset=offset,
+                )
+                count += 1
+                if query.limit is not None and count >= query.limit:
+                    return
+
+    def _record_fields(self, match: "re.Match[bytes]") -> Tuple[bytes, bytes]:
+        groups = match.groupdict()
+        return groups.get("levelname") or b"", groups.get("name") or b""
+
+    def _scan_plain(
+        self, index: SegmentIndex, offset: int
+    ) -> Iterator[Tuple[float, int, bytes, bytes, bytes]]:
+        """
+        Scan plain segment through mmap starting at offset.
+        """
+
+        try:
+            f = open(index.path, "rb")
+        except FileNotFoundError:
+            return
+
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                previous = None
+                for match, ts in self._headers(mm, offset):
+                    if previous is not None:
+                        yield self._record(mm, *previous, match.start())
+                    previous = match, ts
+                if previous is not None:
+                    yield self._record(mm, *previous, size)
+
+    def _record(
+        self, mm: mmap.mmap, match: "re.Match[bytes]", ts: float, end: int
+    ) -> Tuple[float, int, bytes, bytes, bytes]:
+        """
+        Build record tuple from header match and the following continuation lines.
+        """
+
+        levelname, name = self._record_fields(match)
+        message = match.group("message") if "message" in match.re.groupindex else b""
+        if end > match.end() + 1:
+            message += b"\n" + mm[match.end() + 1 : end].rstrip(b"\n")
+
+        return (
+            ts,
+            match.start(),
+            levelname,
+            name,
+            message,
+        )
+
+    def _scan_compressed(
+        self, index: SegmentIndex, offset: int
+    ) -> Iterator[Tuple[float, int, bytes, bytes, bytes]]:
+        """
+        Scan compressed segment line by line starting at decompressed offset.
+        """
+
+        opener = COMPRESSED_OPENERS[os.path.splitext(index.path)[1]]
+        try:
+            f = opener(index.path, "rb")
+        except FileNotFoundError:
+            return
+
+        with f:
+            f.seek(offset)
+            record = None
+            for line in f:
+                match = self._pattern.match(line)
+                ts = self._parse_ts(match.group("asctime")) if match else None
+                if ts is not None:
+                    if record is not None:
+                        yield record
+                    levelname, name = self._record_fields(match)
+                    message = (
+                        match.group("message")
+                        if "message" in match.re.groupindex
+                        else b""
+                    )
+                    record = (
+                        ts,
+                        offset,
+                        levelname,
+                        name,
+                        message,
+                    )
+                elif record is not None:
+                    record = record[:4] + (record[4] + b"\n" + line.rstrip(b"\n"),)
+                offset += len(line)
+
+            if record is not None:
+                yield record
@@ -4,7 +4,8 @@ Logger models.
 
 # Imports from standard library
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from datetime import datetime
+from typing import Dict, Any, List, Optional
 
 # Imports from third party libraries
 import logging
@@ -36,3 +37,31 @@ class LogConfig:
         # Set file name
         if self.file_config is not None:
             self.file_config["name"] = f"{self.name}.log"
+
+
+@dataclass
+class LogQuery:
+    """
+    Log query filters.
+    """
+
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    level: Optional[str] = None
+    logger: Optional[str] = None
+    contains: Optional[str] = None
+    limit: Optional[int] = None
+
+
+@dataclass
+class LogEntry:
+    """
+    Single log record read back from a log file.
+    """
+
+    timestamp: datetime
+    level: str
+    logger: str
+    message: str
+    segment: str
+    offset: int
@@ -0,0 +1,6 @@
+from .cron import CronExpression
+from .enums import OverlapPolicy
+from .scheduler import CommandScheduler
+from .value_objects import Schedule
+
+__all__ = ["CommandScheduler", "CronExpression", "OverlapPolicy", "Schedule"]
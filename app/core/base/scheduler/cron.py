@@ -0,0 +1,154 @@
+"""
+Module for parsing cron expressions.
+"""
+
+# Imports from standard library
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+
+
+# Field bounds: minute, hour, day of month, month, day of week
+_FIELDS: Tuple[Tuple[str, int, int], ...] = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 6),
+)
+
+_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_NAMES = {
+    "month": {
+        name: number
+        for number, name in enumerate(
+            "jan feb mar apr may jun jul aug sep oct nov dec".split(), start=1
+        )
+    },
+    "weekday": {
+        name: number
+        for number, name in enumerate("sun mon tue wed thu fri sat".split())
+    },
+}
+
+# Give up searching after this many years (e.g. "0 0 31 2 *")
+_MAX_YEARS = 5
+
+
+def _parse_field(value: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    """
+    Parse one cron field ("*", "*/5", "1-10/2", "mon,wed", ...).
+    """
+
+    names = _NAMES.get(name, {})
+    # Sunday may be written as 7 (e.g. "5-7"), folded to 0 after expansion
+    top = 7 if name == "weekday" else high
+
+    def number(token: str) -> int:
+        token = token.lower()
+        result = names[token] if token in names else int(token)
+        if not low <= result <= top:
+            raise ValueError(f"Cron {name} value out of range: {token}")
+        return result
+
+    values = set()
+    for part in value.split(","):
+        base, _, step = part.partition("/")
+        step = int(step) if step else 1
+        if step <= 0:
+            raise ValueError(f"Cron {name} step must be positive: {part}")
+
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_token, end_token = base.split("-", 1)
+            start, end = number(start_token), number(end_token)
+            # Ranges ending on Sunday by name ("fri-sun") end on 7
+            if name == "weekday" and end == 0 and start > 0:
+                end = 7
+            if start > end:
+                raise ValueError(f"Cron {name} range is reversed: {part}")
+        else:
+            start = number(base)
+            end = high if step > 1 else start
+
+        values.update(range(start, end + 1, step))
+
+    if name == "weekday" and 7 in values:
+        values.discard(7)
+        values.add(0)
+
+    return frozenset(values)
+
+
+class CronExpression:
+    """Standard 5-field cron expression"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = _ALIASES.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+
+        (
+            self.minutes,
+            self.hours,
+            self.days,
+            self.months,
+            self.weekdays,
+        ) = (
+            _parse_field(value, name, low, high)
+            for value, (name, low, high) in zip(fields, _FIELDS)
+        )
+
+        # Restricted day and weekday fields match on either (cron semantics)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.isoweekday() % 7) in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Get next matching time strictly after moment (minute precision).
+        """
+
+        current = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment.year + _MAX_YEARS
+
+        while current.year <= limit:
+            if current.month not in self.months:
+                year = current.year + (current.month == 12)
+                month = current.month % 12 + 1
+                current = current.replace(
+                    year=year, month=month, day=1, hour=0, minute=0
+                )
+                continue
+            if not self._day_matches(current):
+                current = (current + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if current.hour not in self.hours:
+                current = (current + timedelta(hours=1)).replace(minute=0)
+                continue
+            if current.minute not in self.minutes:
+                current += timedelta(minutes=1)
+                continue
+            return current
+
+        raise ValueError(f"Cron expression never matches: {self.expression}")
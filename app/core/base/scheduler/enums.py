@@ -0,0 +1,19 @@
+"""
+Enums for scheduling commands.
+"""
+
+# Imports from standard library
+from enum import Enum
+
+# ------------------------------------
+# Enums
+# ------------------------------------
+
+
+class OverlapPolicy(Enum):
+    """What to do when a run is due while the previous one is in flight"""
+
+    # Drop the due run
+    SKIP = "SKIP"
+    # Run once right after the previous run finishes, however many were missed
+    COALESCE = "COALESCE"
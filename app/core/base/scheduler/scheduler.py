@@ -0,0 +1,286 @@
+"""
+Module for running commands periodically.
+"""
+
+# Imports from standard library
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Imports from commander core service
+from app.core.base.commander import CommandExecutor
+
+# Imports from tracing core service
+from app.core.base.tracing import Span, Tracer
+
+# Imports from local modules
+from .enums import OverlapPolicy
+from .value_objects import Schedule
+
+
+class CommandScheduler:
+    """Class for running registered commands on intervals or cron expressions"""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        commander: CommandExecutor,
+        max_workers: int = 4,
+        schedules: Optional[List[dict]] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        self._logger = logger.getChild("CommandScheduler")
+        self._commander = commander
+        self._tracer = tracer or Tracer()
+        self.max_workers = max_workers
+        self._schedules: Dict[str, Schedule] = {}
+        # Heap of (due time, sequence, schedule); stale items are skipped lazily
+        self._heap: List[Tuple[float, int, Schedule]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        for options in schedules or []:
+            self.add(**options)
+
+    @property
+    def schedules(self) -> List[Schedule]:
+        with self._condition:
+            return list(self._schedules.values())
+
+    def get(self, name: str) -> Optional[Schedule]:
+        return self._schedules.get(name)
+
+    # ------------------------------------
+    # Registration
+    # ------------------------------------
+
+    def _next_due(self, schedule: Schedule, after: float) -> float:
+        """
+        Get next due time with jitter; intervals keep their nominal grid.
+        """
+
+        if schedule.interval is not None:
+            nominal = (schedule.next_run or after) + schedule.interval
+            # Catch up after long runs or pauses without firing a burst
+            if nominal < after:
+                missed = (after - nominal) // schedule.interval + 1
+                nominal += missed * schedule.interval
+        else:
+            nominal = schedule.cron.next_after(
+                datetime.fromtimestamp(after)
+            ).timestamp()
+
+        schedule.next_run = nominal
+        return (
+            nominal + random.uniform(0, schedule.jitter) if schedule.jitter else nominal
+        )
+
+    def _push(self, due: float, schedule: Schedule) -> None:
+        heapq.heappush(self._heap, (due, next(self._sequence), schedule))
+        if self._heap[0][2] is schedule:
+            self._condition.notify()
+
+    def add(self, name: str, command, **kwargs) -> Schedule:
+        """
+        Register schedule, replacing existing one with the same name.
+
+        Args:
+            name: Schedule name.
+            command: Command to execute (str or list).
+            **kwargs: Schedule fields (interval or cron, jitter, overlap,
+                use_sudo, use_shell, timeout, policy, on_result).
+
+        Returns:
+            Registered schedule.
+        """
+
+        schedule = Schedule(name=name, command=command, **kwargs)
+
+        with self._condition:
+            previous = self._schedules.pop(name, None)
+            if previous is not None:
+                previous.cancelled = True
+            self._schedules[name] = schedule
+
+            # First interval run is spread over the interval by jitter only
+            now = time.time()
+            if schedule.interval is not None:
+                schedule.next_run = now
+                due = (
+                    now + random.uniform(0, schedule.jitter) if schedule.jitter else now
+                )
+            else:
+                due = self._next_due(schedule, now)
+            self._push(due, schedule)
+
+        self._logger.debug("Schedule %s registered", name)
+        return schedule
+
+    def remove(self, name: str) -> bool:
+        """
+        Unregister schedule; a run in flight is left to finish.
+        """
+
+        with self._condition:
+            schedule = self._schedules.pop(name, None)
+            if schedule is None:
+                return False
+            schedule.cancelled = True
+
+        self._logger.debug("Schedule %s removed", name)
+        return True
+
+    # ------------------------------------
+    # Lifecycle
+    # ------------------------------------
+
+    def start(self) -> None:
+        """
+        Start timer thread and worker pool.
+        """
+
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="scheduler-run"
+            )
+            self._thread = threading.Thread(
+                target=self._loop, name="scheduler-timer", daemon=True
+            )
+            self._thread.start()
+
+        self._logger.info("Scheduler started with %d schedules", len(self._schedules))
+
+    def stop(self, wait: bool = False) -> None:
+        """
+        Stop timer thread; running commands are left to finish, queued runs
+        are cancelled.
+        """
+
+        with self._condition:
+            if self._thread is None:
+                return
+            self._stopped = True
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+            pool, self._pool = self._pool, None
+
+        thread.join()
+        pool.shutdown(wait=wait, cancel_futures=True)
+        self._logger.info("Scheduler stopped")
+
+    def _loop(self) -> None:
+        with self._condition:
+            while not self._stopped:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                due, _, schedule = self._heap[0]
+                delay = due - time.time()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                heapq.heappop(self._heap)
+                if schedule.cancelled:
+                    continue
+
+                self._fire(schedule)
+                self._push(self._next_due(schedule, time.time()), schedule)
+
+    # ------------------------------------
+    # Runs
+    # ------------------------------------
+
+    def _fire(self, schedule: Schedule) -> None:
+        """
+        Start run or apply overlap policy (called with condition held).
+        """
+
+        if schedule.running:
+            if schedule.overlap == OverlapPolicy.COALESCE:
+                schedule.pending = True
+            else:
+                schedule.skipped += 1
+                self._logger.debug("Schedule %s skipped, still running", schedule.name)
+            return
+
+        schedule.running = True
+        run_span, queue_span = self._enqueue_spans(schedule)
+        future = self._pool.submit(self._run, schedule, run_span, queue_span)
+        future.add_done_callback(
+            partial(self._on_done, schedule, run_span, queue_span)
+        )
+
+    def _on_done(
+        self, schedule: Schedule, run_span: Span, queue_span: Span, future: Future
+    ) -> None:
+        """
+        Release schedule whose queued run was cancelled by stop().
+        """
+
+        if not future.cancelled():
+            return
+
+        with self._condition:
+            schedule.running = False
+            schedule.pending = False
+        queue_span.set_attribute("cancelled", True)
+        queue_span.end()
+        run_span.end()
+
+    def _enqueue_spans(self, schedule: Schedule) -> Tuple[Span, Span]:
+        """
+        Start run trace and its queue span at enqueue time.
+        """
+
+        run_span = self._tracer.start_trace("scheduler.run", schedule=schedule.name)
+        return run_span, run_span.child("scheduler.queue")
+
+    def _run(self, schedule: Schedule, run_span: Span, queue_span: Span) -> None:
+        while True:
+            # Dequeued: queue span ends, run span covers the execution
+            queue_span.end()
+            schedule.last_run = time.time()
+            with run_span:
+                result = self._commander.execute(
+                    schedule.command,
+                    use_sudo=schedule.use_sudo,
+                    use_shell=schedule.use_shell,
+                    timeout=schedule.timeout,
+                    policy=schedule.policy,
+                )
+            schedule.last_result = result
+            schedule.runs += 1
+            self._logger.debug(
+                "Schedule %s finished: %s", schedule.name, result.status.value
+            )
+
+            if schedule.on_result is not None:
+                try:
+                    schedule.on_result(schedule, result)
+                except Exception as e:
+                    self._logger.error(
+                        "Schedule %s result callback failed: %s", schedule.name, str(e)
+                    )
+
+            with self._condition:
+                if not schedule.pending or schedule.cancelled or self._stopped:
+                    schedule.running = False
+                    schedule.pending = False
+                    return
+                schedule.pending = False
+                run_span, queue_span = self._enqueue_spans(schedule)
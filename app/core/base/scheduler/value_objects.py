@@ -0,0 +1,57 @@
+"""
+Models for scheduling commands.
+"""
+
+# Imports from standard library
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Union
+
+# Imports from commander core service
+from app.core.base.commander import CommandResult
+
+# Imports from local modules
+from .cron import CronExpression
+from .enums import OverlapPolicy
+
+# ------------------------------------
+# Models
+# ------------------------------------
+
+
+@dataclass
+class Schedule:
+    """Recurring command schedule and its run state"""
+
+    name: str
+    command: Union[str, List[str]]
+    interval: Optional[float] = None
+    cron: Optional[Union[CronExpression, str]] = None
+    jitter: float = 0
+    overlap: Union[OverlapPolicy, str] = OverlapPolicy.SKIP
+    use_sudo: bool = False
+    use_shell: bool = False
+    timeout: Optional[int] = None
+    policy: Optional[str] = None
+    on_result: Optional[Callable[["Schedule", CommandResult], None]] = field(
+        default=None, repr=False
+    )
+
+    # Run state
+    next_run: Optional[float] = None
+    last_run: Optional[float] = None
+    last_result: Optional[CommandResult] = field(default=None, repr=False)
+    runs: int = 0
+    skipped: int = 0
+    running: bool = False
+    pending: bool = False
+    cancelled: bool = False
+
+    def __post_init__(self) -> None:
+        if (self.interval is None) == (self.cron is None):
+            raise ValueError(f"Schedule {self.name} needs either interval or cron")
+        if self.interval is not None and self.interval <= 0:
+            raise ValueError(f"Schedule {self.name} interval must be positive")
+        if isinstance(self.cron, str):
+            self.cron = CronExpression(self.cron)
+        if isinstance(self.overlap, str):
+            self.overlap = OverlapPolicy(self.overlap.upper())
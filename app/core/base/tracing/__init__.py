@@ -0,0 +1,24 @@
+from .exporters import FileExporter, RingBufferExporter, SpanExporter, to_otlp
+from .tracer import (
+    NOOP_SPAN,
+    Span,
+    TraceContextFilter,
+    Tracer,
+    current_span,
+    get_tracer,
+    span,
+)
+
+__all__ = [
+    "FileExporter",
+    "RingBufferExporter",
+    "SpanExporter",
+    "to_otlp",
+    "NOOP_SPAN",
+    "Span",
+    "TraceContextFilter",
+    "Tracer",
+    "current_span",
+    "get_tracer",
+    "span",
+]
@@ -0,0 +1,143 @@
+"""
+Module for exporting finished spans.
+"""
+
+# Imports from standard library
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+
+if TYPE_CHECKING:
+    # Imports from local modules
+    from .tracer import Span
+
+
+class SpanExporter:
+    """Base class for span exporters"""
+
+    def export(self, span: "Span") -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RingBufferExporter(SpanExporter):
+    """Keeps last finished spans in memory for the debug endpoint"""
+
+    def __init__(self, size: int = 2048):
+        self._spans = deque(maxlen=size)
+
+    def export(self, span: "Span") -> None:
+        # deque.append is atomic, no lock needed
+        self._spans.append(span)
+
+    def spans(
+        self, trace_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> List["Span"]:
+        """
+        Get finished spans, newest last.
+        """
+
+        spans = list(self._spans)
+        if trace_id is not None:
+            spans = [span for span in spans if span.trace_id == trace_id]
+        if limit is not None:
+            spans = spans[-limit:]
+
+        return spans
+
+
+class FileExporter(SpanExporter):
+    """Appends finished spans to a JSON lines file"""
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    def export(self, span: "Span") -> None:
+        line = json.dumps(span.to_dict(), default=str, separators=(",", ":"))
+        with self._lock:
+            # Reopened after close() so a restarted server keeps exporting
+            if self._file.closed:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            now = time.monotonic()
+            if now - self._flushed_at >= self.flush_interval:
+                self._file.flush()
+                self._flushed_at = now
+
+    def close(self) -> None:
+        """
+        Flush buffered spans and close file.
+        """
+
+        with self._lock:
+            self._file.close()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: Iterable["Span"], service_name: str = "verai") -> Dict[str, Any]:
+    """
+    Convert spans to OTLP/JSON ExportTraceServiceRequest.
+    """
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {
+                            "key": "service.name",
+                            "value": {"stringValue": service_name},
+                        }
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app.core.base.tracing"},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                "parentSpanId": span.parent_id or "",
+                                "name": span.name,
+                                "kind": 1,
+                                "startTimeUnixNano": str(span.start_ns),
+                                "endTimeUnixNano": str(span.end_ns),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)}
+                                    for key, value in span.attributes.items()
+                                ],
+                                "status": (
+                                    {"code": 2, "message": span.error}
+                                    if span.error
+                                    else {"code": 0}
+                                ),
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
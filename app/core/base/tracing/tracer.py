@@ -0,0 +1,318 @@
+"""
+Module for lightweight tracing spans.
+"""
+
+# Imports from standard library
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Imports from local modules
+from .exporters import FileExporter, RingBufferExporter, SpanExporter
+
+
+# Currently active span of this thread / task
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """Timed operation within a trace"""
+
+    __slots__ = (
+        "tracer",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+        "_token",
+    )
+
+    sampled = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        start_ns: Optional[int] = None,
+    ):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.error: Optional[str] = None
+        self._token = None
+
+    @property
+    def traceparent(self) -> str:
+        """
+        W3C trace context header value.
+        """
+
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def child(self, name: str, **attributes) -> "Span":
+        return Span(self.tracer, name, self.trace_id, self.span_id, attributes or None)
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer.export(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        self.end()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": (
+                (self.end_ns - self.start_ns) / 1e6 if self.end_ns else None
+            ),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class NoopSpan:
+    """Span used when trace is not sampled; every operation is a no-op"""
+
+    __slots__ = ()
+
+    sampled = False
+    trace_id = None
+    span_id = None
+    traceparent = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def child(self, name: str, **attributes) -> "NoopSpan":
+        return self
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+
+def current_span() -> Optional[Span]:
+    """
+    Get active sampled span or None.
+    """
+
+    return _current.get()
+
+
+def span(name: str, **attributes) -> Union["Span", "NoopSpan"]:
+    """
+    Start child span of the active span; no-op outside sampled traces.
+    """
+
+    parent = _current.get()
+    if parent is None:
+        return NOOP_SPAN
+
+    return parent.child(name, **attributes)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse W3C traceparent header.
+
+    Returns:
+        (trace id, parent span id, sampled flag) or None if invalid.
+    """
+
+    if not value:
+        return None
+
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+
+    return parts[1], parts[2], bool(flags & 1)
+
+
+class Tracer:
+    """Class for starting sampled traces and exporting finished spans"""
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        sample_rate: float = 0.0,
+        ring_size: int = 2048,
+        file_path: Optional[str] = None,
+        exporters: Optional[List[SpanExporter]] = None,
+    ):
+        self._logger = logger.getChild("Tracer") if logger is not None else None
+        self.sample_rate = sample_rate
+        self.ring = RingBufferExporter(ring_size)
+        self.exporters: List[SpanExporter] = [self.ring, *(exporters or [])]
+        if file_path and sample_rate > 0:
+            self.exporters.append(FileExporter(file_path))
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def start_trace(
+        self,
+        name: str,
+        traceparent: Optional[str] = None,
+        start_ns: Optional[int] = None,
+        **attributes,
+    ) -> Union["Span", "NoopSpan"]:
+        """
+        Start root span, continuing remote trace from traceparent if given.
+
+        Remote sampled flag is honoured; otherwise sample_rate decides.
+        """
+
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+            if not sampled:
+                return NOOP_SPAN
+        else:
+            if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+                return NOOP_SPAN
+            trace_id, parent_id = os.urandom(16).hex(), None
+
+        return Span(self, name, trace_id, parent_id, attributes or None, start_ns)
+
+    def span(self, name: str, **attributes) -> Union["Span", "NoopSpan"]:
+        """
+        Start child of the active span, or new sampled root span.
+        """
+
+        parent = _current.get()
+        if parent is not None:
+            return parent.child(name, **attributes)
+        if self.sample_rate <= 0:
+            return NOOP_SPAN
+
+        return self.start_trace(name, **attributes)
+
+    def export(self, finished: Span) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(finished)
+            except Exception as e:
+                if self._logger is not None:
+                    self._logger.warning("Span export failed: %s", str(e))
+
+    def close(self) -> None:
+        for exporter in self.exporters:
+            exporter.close()
+
+    # ------------------------------------
+    # Logging integration
+    # ------------------------------------
+
+    def install_logging(self, logger: logging.Logger) -> None:
+        """
+        Add trace ids to log records and trace handler I/O of sampled traces.
+
+        Records get trace_id and span_id attributes (empty outside traces),
+        usable in format as %(trace_id)s.
+        """
+
+        for handler in logger.handlers:
+            if not any(isinstance(f, TraceContextFilter) for f in handler.filters):
+                handler.addFilter(TraceContextFilter())
+            if self.enabled and not getattr(handler.emit, "traced", False):
+                handler.emit = _traced_emit(handler)
+
+
+class TraceContextFilter(logging.Filter):
+    """Logging filter adding active trace ids to records"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        active = _current.get()
+        record.trace_id = active.trace_id if active is not None else ""
+        record.span_id = active.span_id if active is not None else ""
+        return True
+
+
+def _traced_emit(handler: logging.Handler):
+    emit = handler.emit
+    name = f"logger.{type(handler).__name__}"
+
+    def traced_emit(record: logging.LogRecord) -> None:
+        parent = _current.get()
+        if parent is None:
+            emit(record)
+            return
+        # Not entered as current span so nested logging is not traced again
+        child = parent.child(name)
+        try:
+            emit(record)
+        finally:
+            child.end()
+
+    traced_emit.traced = True
+    return traced_emit
+
+
+def get_tracer(
+    logger: logging.Logger,
+    sample_rate: float = 0.0,
+    ring_size: int = 2048,
+    file_path: Optional[str] = None,
+) -> Tracer:
+    """
+    Get tracer with trace ids attached to logger records.
+    """
+
+    tracer = Tracer(
+        logger=logger,
+        sample_rate=sample_rate or 0.0,
+        ring_size=ring_size or 2048,
+        file_path=file_path,
+    )
+    tracer.install_logging(logger)
+
+    return tracer
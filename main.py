@@ -1,3 +1,6 @@
+import argparse
+import sys
+
 from app.core.application import get_core_application
 import uvicorn
 
@@ -28,5 +31,35 @@ def run_api_server():
     )
 
 
+def run_agent(argv=None):
+    """
+    Run command agent
+    """
+
+    # Address and id overrides allow several agents per machine
+    parser = argparse.ArgumentParser(prog="main.py agent")
+    parser.add_argument("--address", help="host:port or unix:/path/to/socket")
+    parser.add_argument("--id", dest="agent_id", help="agent id")
+    args = parser.parse_args(argv)
+
+    # Get core application
+    APP = get_core_application()
+
+    if args.address:
+        APP.container.configuration.agent.address.from_value(args.address)
+    if args.agent_id:
+        APP.container.configuration.agent.id.from_value(args.agent_id)
+
+    agent = APP.container.agent()
+
+    try:
+        agent.serve_forever()
+    except KeyboardInterrupt:
+        agent.stop()
+
+
 if __name__ == "__main__":
-    run_api_server()
+    if len(sys.argv) > 1 and sys.argv[1] == "agent":
+        run_agent(sys.argv[2:])
+    else:
+        run_api_server()